@@ -1,28 +1,40 @@
+import os
+
 import streamlit as st
 import pandas as pd
-import yfinance as yf
-import feedparser
-import urllib.parse
-from pypdf import PdfReader
 
 # ======================================================
 # IMPORT LOGIC MODULES
 # ======================================================
 from logic_fundamentals import (
-    fetch_fundamentals,
+    fetch_fundamentals_cached,
     evaluate_metric,
     detect_red_flags,
-    apply_fundamental_fallbacks
+    store_reported_fundamentals
 )
 
+from logic_failure_cache import FAILURES
+from logic_quotes import get_quotes
+from logic_symbols import get_symbol_master
 from logic_valuation import estimate_fair_value
-from logic_news import analyze_news
-from logic_quarterly import analyze_quarterly_text
+from logic_report_jobs import REPORT_JOBS
+from logic_fundamentals_record import Fundamentals
+from logic_quarterly_numbers import (
+    merge_quarterly_results,
+    results_fundamentals,
+    statement_mentions
+)
+from logic_news import analyze_news, get_news, news_history
 from logic_scoring import score_stock, detect_profile_mismatch
 from logic_explanation import generate_explanation
 from logic_confidence import confidence_band, conviction_label
 from logic_market_regime import detect_market_regime
 from logic_ai_explain import ai_ask_why
+from logic_sensitivity import describe_flips, what_if
+from logic_cache_warmer import CacheWarmer
+from logic_disk_cache import STALENESS
+from logic_graph import ComputationGraph, Uncached
+from logic_news import NEWS_TTL
 
 from logic_portfolio import (
     build_portfolio,
@@ -33,14 +45,6 @@ from logic_portfolio import (
     adjust_for_market_regime
 )
 
-@st.cache_data(ttl=1800)
-def fetch_news(company):
-    import feedparser, urllib.parse
-
-    q = urllib.parse.quote(f"{company} stock India")
-    url = f"https://news.google.com/rss/search?q={q}&hl=en-IN&gl=IN&ceid=IN:en"
-    return feedparser.parse(url).entries[:5]
-    
 # ======================================================
 # PAGE CONFIG
 # ======================================================
@@ -52,15 +56,30 @@ st.set_page_config(
 st.title("📊 Nifty 50 – AI Portfolio Advisory")
 st.caption("Private decision-support tool | Rule-based AI engine")
 
+# ======================================================
+# COMPUTATION GRAPH (PER SESSION)
+# ======================================================
+# Every expensive step below is a graph node with explicit inputs;
+# a rerun only recomputes nodes whose inputs changed (or whose
+# ttl expired). Rendering still runs on every rerun.
+graph = ComputationGraph(st.session_state.setdefault("graph", {})).begin_run()
+
+QUOTE_TTL = STALENESS["quotes"]["*"]
+FUNDAMENTALS_TTL = STALENESS["fundamentals"]["PE"]
+
 # ======================================================
 # LOAD DATA
 # ======================================================
 @st.cache_data
 def load_nifty50():
-    return pd.read_csv("data/nifty50_list.csv")
+    return get_symbol_master().frame.copy()
 
-df_all = load_nifty50()
-df = df_all.copy()
+def filter_sector(df_all, sector):
+    if sector == "All":
+        return df_all
+    return df_all[df_all["Sector"] == sector]
+
+df_all = graph.node("symbols", load_nifty50)
 
 # ======================================================
 # SIDEBAR – FILTERS
@@ -71,11 +90,10 @@ portfolio_mode = st.sidebar.checkbox("Enable Portfolio Mode", value=False)
 
 sector = st.sidebar.selectbox(
     "Sector",
-    ["All"] + sorted(df["Sector"].dropna().unique())
+    ["All"] + sorted(df_all["Sector"].dropna().unique())
 )
 
-if sector != "All":
-    df = df[df["Sector"] == sector]
+df = graph.node("sector_filter", filter_sector, deps=("symbols",), sector=sector)
 
 if portfolio_mode:
     selected_stocks = st.sidebar.multiselect(
@@ -87,6 +105,14 @@ else:
     stock = st.sidebar.selectbox("Select Stock", df["Symbol"].tolist())
     selected_stocks = [stock]
 
+# Optional background warm-up (ADVISOR_CACHE_WARMER=1)
+@st.cache_resource
+def get_cache_warmer():
+    return CacheWarmer().start()
+
+if os.environ.get("ADVISOR_CACHE_WARMER") == "1":
+    get_cache_warmer().mark_visible(selected_stocks)
+
 st.sidebar.markdown("---")
 st.sidebar.header("Investor Profile")
 
@@ -144,42 +170,35 @@ market = detect_market_regime(
 # ======================================================
 # PRICE FETCHING (CMP)
 # ======================================================
-YAHOO_MAP = {
-    "M&M": "MM",
-    "TATAMOTORS": "TATAMOTORS",
-    "RELIANCE": "RELIANCE"
-}
-
-@st.cache_data(ttl=300)
+# Successes live in the disk quote cache; failures back off in
+# logic_failure_cache instead of being cached as real prices.
+# Failed prices are returned as Uncached so the graph retries them
+# on the next rerun rather than memoizing the gap for QUOTE_TTL.
 def get_cmp(symbol):
-    sym = YAHOO_MAP.get(symbol, symbol)
-    ticker = yf.Ticker(sym + ".NS")
-
-    try:
-        price = ticker.fast_info.get("lastPrice")
-        if price:
-            return round(price, 2)
-    except:
-        pass
-
-    try:
-        price = ticker.info.get("regularMarketPrice")
-        if price:
-            return round(price, 2)
-    except:
-        pass
-
-    try:
-        hist = ticker.history(period="1d")
-        if not hist.empty:
-            return round(hist["Close"].iloc[-1], 2)
-    except:
-        pass
-
-    return None
-
-if "CMP (₹)" not in df.columns:
-    df["CMP (₹)"] = df["Symbol"].apply(get_cmp)
+    price = get_quotes([symbol]).iloc[0]
+    return Uncached(None) if pd.isna(price) else float(price)
+
+def get_cmp_bulk(symbols):
+    quotes = get_quotes(symbols)
+    return Uncached(quotes) if quotes.isna().any() else quotes
+
+def with_cmp(df, quotes):
+    df = df.copy()
+    df["CMP (₹)"] = df["Symbol"].map(quotes)
+    return df
+
+graph.node(
+    "quotes",
+    lambda df_all: get_cmp_bulk(tuple(df_all["Symbol"])),
+    deps=("symbols",),
+    ttl=QUOTE_TTL
+)
+df = graph.node("table", with_cmp, deps=("sector_filter", "quotes"))
+
+quarantine = FAILURES.snapshot()
+if quarantine:
+    with st.sidebar.expander(f"🩺 Data health ({len(quarantine)} failing)"):
+        st.dataframe(pd.DataFrame(quarantine), hide_index=True)
 
 # ======================================================
 # MAIN TABLE
@@ -196,14 +215,33 @@ if goal_mode:
 
     from logic_goal_based_advisor import recommend_stocks_for_goal
 
-    recommendations = recommend_stocks_for_goal(
-        df=df_all,
+    # Results with failed fetches are retried on the next rerun
+    def goal_recommendations(df_all, **goal):
+        fetch_errors = {}
+        recommendations = recommend_stocks_for_goal(
+            df=df_all, fetch_errors=fetch_errors, **goal
+        )
+        result = recommendations, fetch_errors
+        return Uncached(result) if fetch_errors else result
+
+    recommendations, fetch_errors = graph.node(
+        "goal",
+        goal_recommendations,
+        deps=("symbols",),
+        ttl=FUNDAMENTALS_TTL,
         investment_amount=investment_amount,
         risk_profile=risk_profile,
         duration_months=goal_duration_months,
         expected_return_pref=expected_return_pref
     )
 
+    if fetch_errors:
+        with st.expander(f"⚠️ Data unavailable for {len(fetch_errors)} stocks"):
+            st.dataframe(
+                pd.DataFrame.from_dict(fetch_errors, orient="index"),
+                use_container_width=True
+            )
+
     if not recommendations:
         st.warning("No suitable stocks found for the selected goal.")
     else:
@@ -227,15 +265,29 @@ if not portfolio_mode:
     st.markdown("---")
 
     row = df_all[df_all["Symbol"] == stock].iloc[0]
-    cmp_price = get_cmp(stock)
+    cmp_price = graph.node("cmp", get_cmp, ttl=QUOTE_TTL, symbol=stock)
 
     st.header(f"{row['Company']} ({stock})")
     st.write(f"**Sector:** {row['Sector']}")
     st.write(f"**CMP:** ₹{cmp_price if cmp_price else '—'}")
 
     # ---------------- FUNDAMENTALS ----------------
-    fund = fetch_fundamentals(stock)
-    fund = apply_fundamental_fallbacks(fund)
+    # Reported figures and the disk cache first; .info only for
+    # fields neither has in date
+    NO_FUNDAMENTALS = Fundamentals.from_mapping({}).with_fallbacks()
+
+    def load_fundamentals(symbol):
+        try:
+            return fetch_fundamentals_cached(symbol)
+        except LookupError:
+            return Uncached(NO_FUNDAMENTALS)
+
+    fund = graph.node(
+        "fundamentals", load_fundamentals, ttl=FUNDAMENTALS_TTL, symbol=stock
+    )
+
+    if fund == NO_FUNDAMENTALS:
+        st.warning("Fundamentals are unavailable right now; conservative defaults are shown.")
 
     st.markdown("### 📊 Valuation & Profitability")
 
@@ -263,8 +315,13 @@ if not portfolio_mode:
     # ---------------- FAIR VALUE ----------------
     st.markdown("### 💰 Fair Value & Entry Zone")
 
-    fair_value, upside_pct, entry_zone = estimate_fair_value(
-        stock, fund, get_cmp
+    fair_value, upside_pct, entry_zone = graph.node(
+        "fair_value",
+        lambda fund, cmp_price, symbol: estimate_fair_value(
+            symbol, fund, lambda _: cmp_price
+        ),
+        deps=("fundamentals", "cmp"),
+        symbol=stock
     )
 
     fc1, fc2, fc3 = st.columns(3)
@@ -278,8 +335,13 @@ if not portfolio_mode:
 if not portfolio_mode:
     st.markdown("### 📰 Recent News")
     
-    news = fetch_news(row["Company"])
-    news_summary = analyze_news(news)
+    def load_news(company):
+        news = get_news(company)
+        return news, analyze_news(news)
+
+    news, news_summary = graph.node(
+        "news", load_news, ttl=NEWS_TTL, company=row["Company"]
+    )
     
     if not news:
         st.write("No recent news found.")
@@ -294,50 +356,210 @@ if not portfolio_mode:
             for n in news:
                 st.markdown(f"- [{n.title}]({n.link})")
 
+        with st.expander("Sentiment History"):
+            st.dataframe(
+                pd.DataFrame(graph.node(
+                    "news_history",
+                    lambda _, company: news_history(company),
+                    deps=("news",),
+                    company=row["Company"]
+                )).T,
+                use_container_width=True
+            )
+
     # ---------------- REPORTS ----------------
     st.markdown("### 📑 Company Reports")
 
     annual_pdf = st.file_uploader("Annual Report (PDF)", type=["pdf"])
     quarterly_pdf = st.file_uploader("Quarterly Report (PDF)", type=["pdf"])
 
-    def extract_text(pdf):
-        if not pdf:
-            return ""
-        reader = PdfReader(pdf)
-        return " ".join(
-            p.extract_text() or "" for p in reader.pages[:5]
-        ).lower()
+    # Parsed in the background: the sections below render at once
+    # and pick up report signals when extraction finishes
+    def upload_key(upload):
+        return upload.file_id if upload else None
+
+    # A job whose data left the report cache is submitted again
+    for name in ("annual_job", "quarterly_job"):
+        previous = graph.value(name)
+        if previous is not None and previous.evicted:
+            graph.invalidate(name)
+
+    annual_job = graph.node(
+        "annual_job",
+        lambda upload: REPORT_JOBS.submit(annual_pdf, "annual"),
+        upload=upload_key(annual_pdf)
+    )
+    quarterly_job = graph.node(
+        "quarterly_job",
+        lambda upload: REPORT_JOBS.submit(quarterly_pdf, "quarterly"),
+        upload=upload_key(quarterly_pdf)
+    )
 
-    annual_text = extract_text(annual_pdf)
-    quarterly_text = extract_text(quarterly_pdf)
+    pending_jobs = [
+        (label, job)
+        for label, job in [
+            ("annual report", annual_job),
+            ("quarterly report", quarterly_job),
+        ]
+        if job and not job.ready
+    ]
+
+    if pending_jobs:
+        @st.fragment(run_every=1.0)
+        def report_status():
+            if all(job.ready for _, job in pending_jobs):
+                st.rerun(scope="app")
+            for label, job in pending_jobs:
+                st.progress(
+                    job.done / job.total if job.total else 0.0,
+                    text=f"Reading {label}: page {job.done}/{job.total or '?'}"
+                )
+
+        report_status()
+
+    for label, job in [
+        ("annual report", annual_job),
+        ("quarterly report", quarterly_job),
+    ]:
+        if job and job.error:
+            st.warning(f"Could not read the {label}: {job.error}")
+
+    # The node holds the finished jobs, not their data: report data
+    # is read back from the report cache, so sessions never pin it
+    def report_jobs(annual_job, quarterly_job, ready):
+        def finished(job):
+            return job if job and job.ready else None
+        return finished(annual_job), finished(quarterly_job)
+
+    def report_values(reports):
+        return tuple(job.value if job else None for job in reports)
+
+    # Recomputed when an upload changes or a job finishes
+    reports = graph.node(
+        "reports",
+        report_jobs,
+        deps=("annual_job", "quarterly_job"),
+        ready=[bool(job and job.ready) for job in (annual_job, quarterly_job)]
+    )
 
-    q_score, q_signals = analyze_quarterly_text(quarterly_text)
+    annual_data, quarterly_data = report_values(reports)
+
+    q_results = quarterly_data.results if quarterly_data else None
+
+    # Figures are persisted for the symbol only when the statement
+    # names the company and reports a quarter that is still current;
+    # otherwise they apply to this session only
+    def save_reported(reports, company, symbol):
+        _, quarterly_data = report_values(reports)
+        q_results = quarterly_data.results if quarterly_data else None
+        if (
+            q_results is None
+            or not q_results.valid
+            or not statement_mentions(quarterly_data.index, company, symbol)
+        ):
+            return False
+        return store_reported_fundamentals(
+            symbol, results_fundamentals(q_results), q_results.period_end
+        )
 
-    # ---------------- SCORING ----------------
-    score, rec, reasons = score_stock(
-        fund,
-        news_summary,
-        annual_text,
-        quarterly_text,
-        risk_profile
+    report_saved = graph.node(
+        "report_saved",
+        save_reported,
+        deps=("reports",),
+        company=row["Company"],
+        symbol=stock
     )
 
-    if q_score:
-        score = max(0, min(100, score + q_score))
-        for s in q_signals:
-            reasons.append(f"Quarterly: {s}")
-
-    confidence = confidence_band(
-        score,
-        len(detect_red_flags(fund)),
-        len(detect_profile_mismatch(fund, risk_profile))
+    def reported_fundamentals(fund, reports):
+        # Reported growth & margin replace the .info estimates
+        _, quarterly_data = report_values(reports)
+        q_results = quarterly_data.results if quarterly_data else None
+        if q_results is None or not q_results.valid:
+            return fund
+        return merge_quarterly_results(fund, q_results)
+
+    fund = graph.node(
+        "reported_fundamentals",
+        reported_fundamentals,
+        deps=("fundamentals", "reports")
     )
 
-    final_rec = conviction_label(rec, confidence, score)
+    if q_results:
+        period = (
+            f"quarter ended {q_results.period_end:%d %b %Y}, "
+            if q_results.period_end else ""
+        )
+        st.markdown(f"**Quarterly results ({period}p. {q_results.page})**")
+        st.dataframe(
+            pd.DataFrame({
+                "Current": q_results.current,
+                "Previous Qtr": q_results.previous,
+                "Year Ago": q_results.year_ago,
+            }).dropna(how="all"),
+            use_container_width=True
+        )
+
+        if not q_results.valid:
+            st.warning(
+                "Quarterly figures failed consistency checks and were not used."
+            )
+        elif not report_saved:
+            st.caption(
+                f"Figures are used for this session only: the statement "
+                f"does not name {row['Company']}, or its quarter is undated "
+                "or no longer current."
+            )
+
+    # ---------------- SCORING ----------------
+    def score_view(fund, news, reports, risk_profile, pending):
+        _, news_summary = news
+        annual_data, quarterly_data = report_values(reports)
+
+        # Page-aware indexes: signals cite the page they came from
+        score, rec, reasons = score_stock(
+            fund,
+            news_summary,
+            annual_data.index if annual_data else None,
+            quarterly_data.index if quarterly_data else None,
+            risk_profile
+        )
+
+        if quarterly_data and quarterly_data.q_score:
+            score = max(0, min(100, score + quarterly_data.q_score))
+            for s in quarterly_data.q_signals:
+                reasons.append(f"Quarterly: {s}")
+
+        # Shown until the background job finishes and the page reruns
+        for label in pending:
+            reasons.append(f"{label.capitalize()} signals: pending")
+
+        confidence = confidence_band(
+            score,
+            len(detect_red_flags(fund)),
+            len(detect_profile_mismatch(fund, risk_profile))
+        )
+
+        final_rec = conviction_label(rec, confidence, score)
+        return score, rec, reasons, confidence, final_rec
+
+    score, rec, reasons, confidence, final_rec = graph.node(
+        "scoring",
+        score_view,
+        deps=("reported_fundamentals", "news", "reports"),
+        risk_profile=risk_profile,
+        pending=[label for label, _ in pending_jobs]
+    )
 
     st.markdown("## 🧠 AI Explanation")
-    st.markdown(generate_explanation(
-        stock, score, rec, reasons, risk_profile, time_horizon
+    st.markdown(graph.node(
+        "explanation",
+        lambda scoring, stock, risk_profile, time_horizon: generate_explanation(
+            stock, scoring[0], scoring[1], scoring[2], risk_profile, time_horizon
+        ),
+        deps=("scoring",),
+        stock=stock,
+        risk_profile=risk_profile,
+        time_horizon=time_horizon
     ))
 
 # ======================================================
@@ -346,8 +568,25 @@ if not portfolio_mode:
 st.markdown("---")
 st.markdown("## 📊 Portfolio Intelligence")
 
-portfolio = build_portfolio(df_all, selected_stocks)
-portfolio_result = analyze_portfolio(portfolio, risk_profile)
+def portfolio_view(df_all, selected_stocks, risk_profile):
+    portfolio = build_portfolio(df_all, selected_stocks)
+    portfolio_result = analyze_portfolio(portfolio, risk_profile)
+    portfolio_action, reason = portfolio_final_recommendation(
+        portfolio_result["risk_score"]
+    )
+    portfolio_confidence = portfolio_confidence_band(
+        portfolio_result["risk_score"],
+        len(portfolio_result["warnings"])
+    )
+    return portfolio, portfolio_result, portfolio_action, reason, portfolio_confidence
+
+portfolio, portfolio_result, portfolio_action, reason, portfolio_confidence = graph.node(
+    "portfolio",
+    portfolio_view,
+    deps=("symbols",),
+    selected_stocks=selected_stocks,
+    risk_profile=risk_profile
+)
 
 st.metric("Portfolio Risk Score", portfolio_result["risk_score"])
 
@@ -357,9 +596,6 @@ for w in portfolio_result["warnings"]:
 for i in portfolio_result["insights"]:
     st.info(i)
 
-portfolio_action, reason = portfolio_final_recommendation(
-    portfolio_result["risk_score"]
-)
 # ==============================
 # FINAL RECOMMENDATION DISPLAY
 # ==============================
@@ -383,16 +619,37 @@ if not portfolio_mode:
         placeholder="e.g. Why is this a BUY?"
     )
 
-    if user_question:
-        ai_response = ai_ask_why(
-            question=user_question,
+    def answer_stock_question(fund, news, reports, scoring, question, risk_profile):
+        _, news_summary = news
+        annual_data, _ = report_values(reports)
+        score, rec, reasons, confidence, _ = scoring
+
+        flips = what_if(
+            fund,
+            risk_profile,
+            news_summary,
+            annual_data.index if annual_data else None
+        )
+
+        return ai_ask_why(
+            question=question,
             recommendation=rec,
             score=score,
             confidence=confidence,
             reasons=reasons,
             risk_profile=risk_profile,
             market=market,
-            portfolio_mode=False
+            portfolio_mode=False,
+            what_if=describe_flips(flips, rec)
+        )
+
+    if user_question:
+        ai_response = graph.node(
+            "stock_qa",
+            answer_stock_question,
+            deps=("reported_fundamentals", "news", "reports", "scoring"),
+            question=user_question,
+            risk_profile=risk_profile
         )
 
         st.info(ai_response)
@@ -407,9 +664,10 @@ portfolio_question = st.text_input(
     placeholder="e.g. Why should I HOLD this portfolio?"
 )
 
-if portfolio_question:
-    ai_response = ai_ask_why(
-        question=portfolio_question,
+def answer_portfolio_question(portfolio, question, risk_profile):
+    _, portfolio_result, portfolio_action, _, portfolio_confidence = portfolio
+    return ai_ask_why(
+        question=question,
         recommendation=portfolio_action,
         score=portfolio_result["risk_score"],
         confidence=portfolio_confidence,
@@ -419,6 +677,15 @@ if portfolio_question:
         portfolio_mode=True
     )
 
+if portfolio_question:
+    ai_response = graph.node(
+        "portfolio_qa",
+        answer_portfolio_question,
+        deps=("portfolio",),
+        question=portfolio_question,
+        risk_profile=risk_profile
+    )
+
     st.info(ai_response)
 
 st.markdown("## 📋 Portfolio Composition")
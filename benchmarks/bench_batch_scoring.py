@@ -0,0 +1,119 @@
+"""
+Batch scoring benchmark: score_batch vs a score_stock loop.
+
+Checks that both paths agree (scores, labels, reasons) on random
+stocks with values on every rule threshold, then times them at
+50 / 5,000 / 500,000 rows.
+
+Run from the repository root:
+    python benchmarks/bench_batch_scoring.py [--rows 50,5000,500000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic_batch_scoring import decode_reasons, fundamentals_frame, score_batch
+from logic_scoring import score_stock
+
+PROFILES = ["Conservative", "Moderate", "Aggressive"]
+BIASES = [None, "Positive", "Negative", "Neutral"]
+
+# metric -> (low, high, rule thresholds)
+METRICS = {
+    "ROE": (-0.1, 0.4, [0.18, 0.15, 0.10, 0.12]),
+    "ROCE": (0.0, 0.3, [0.15, 0.10, 0.12]),
+    "DebtEquity": (0.0, 3.0, [1, 1.5, 2]),
+    "InterestCover": (0.0, 6.0, [3, 2, 1.5]),
+    "NetMargin": (0.0, 0.3, [0.05, 0.08]),
+    "RevenueGrowth": (-0.2, 0.3, [0.10, 0.05, 0.08, 0]),
+    "EPSGrowth": (-0.2, 0.3, [0.10, 0.05, 0]),
+    "PE": (5.0, 80.0, [25, 30, 40, 45]),
+}
+
+
+def random_fundamentals(rng, n):
+    """
+    n fundamentals dicts: 15% missing, 25% exactly on a threshold.
+    """
+
+    def value(low, high, edges):
+        r = rng.random()
+        if r < 0.15:
+            return None
+        if r < 0.40:
+            return rng.choice(edges)
+        return rng.uniform(low, high)
+
+    return [
+        {m: value(*spec) for m, spec in METRICS.items()}
+        for _ in range(n)
+    ]
+
+
+def check_equivalence(funds):
+    frame = fundamentals_frame(funds)
+    mismatches = 0
+
+    for profile in PROFILES:
+        for bias in BIASES:
+            for annual_risk in (False, True):
+                scores, labels, masks = score_batch(
+                    frame, profile, bias, annual_risk
+                )
+                news = None if bias is None else {"overall": bias}
+                annual_text = "material risk" if annual_risk else ""
+
+                for i, fund in enumerate(funds):
+                    expected = score_stock(fund, news, annual_text, "", profile)
+                    got = (scores[i], labels[i], decode_reasons(masks[i]))
+                    if expected != got:
+                        mismatches += 1
+
+    return mismatches
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="50,5000,500000")
+    parser.add_argument("--check", type=int, default=2000,
+                        help="stocks used for the equivalence check")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+
+    mismatches = check_equivalence(random_fundamentals(rng, args.check))
+    print(f"equivalence: {args.check} stocks x 24 variants, "
+          f"{mismatches} mismatches")
+
+    print(f"{'rows':>9}  {'score_batch':>12}  {'score_stock loop':>17}")
+    for n in (int(r) for r in args.rows.split(",")):
+        funds = random_fundamentals(rng, n)
+        frame = fundamentals_frame(funds)
+        repeat = 5 if n <= 5000 else 1
+
+        batch = best_of(lambda: score_batch(frame, "Moderate"), repeat)
+        loop = best_of(
+            lambda: [score_stock(f, None, "", "", "Moderate") for f in funds],
+            repeat
+        )
+        print(f"{n:>9,}  {batch * 1e3:>9.1f} ms  {loop * 1e3:>14.1f} ms")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
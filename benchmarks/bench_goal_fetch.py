@@ -0,0 +1,84 @@
+"""
+Goal-mode fetch benchmark: concurrent fundamentals loading.
+
+Runs recommend_stocks_for_goal over the Nifty 50 universe against
+FakeProvider (fixed latency per .info call) with a cold cache for
+each worker count, and prints wall-clock time and speedup. Two
+symbols fail throughout; a last run adds one symbol that overruns
+the per-symbol timeout and prints the full error report.
+
+Run from the repository root:
+    python benchmarks/bench_goal_fetch.py [--latency 0.1]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["ADVISOR_CACHE_DIR"] = tempfile.mkdtemp(prefix="advisor-bench-")
+
+from fake_provider import FakeProvider
+from logic_disk_cache import get_disk_cache
+from logic_goal_based_advisor import recommend_stocks_for_goal
+from logic_providers import set_provider
+from logic_snapshot import SNAPSHOTS
+from logic_symbols import get_symbol_master
+
+
+def cold_run(universe, provider, workers, timeout):
+    get_disk_cache().clear()
+    SNAPSHOTS.invalidate()
+    set_provider(provider)
+
+    errors = {}
+    t0 = time.perf_counter()
+    picks = recommend_stocks_for_goal(
+        universe,
+        investment_amount=200000,
+        risk_profile="Moderate",
+        duration_months=12,
+        expected_return_pref="Balanced",
+        max_workers=workers,
+        symbol_timeout=timeout,
+        fetch_deadline=60.0,
+        fetch_errors=errors
+    )
+    return time.perf_counter() - t0, picks, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--workers", default="1,5,10,50")
+    args = parser.parse_args()
+
+    universe = get_symbol_master().frame
+    symbols = universe["Symbol"].tolist()
+    timeout = 10 * args.latency
+
+    provider = FakeProvider(latency=args.latency, failing=symbols[:2])
+
+    baseline = None
+    for workers in (int(w) for w in args.workers.split(",")):
+        elapsed, picks, errors = cold_run(universe, provider, workers, timeout)
+        baseline = baseline or elapsed
+        kinds = dict(Counter(e["error"] for e in errors.values()))
+        print(f"{workers:>3} workers  {elapsed:6.2f} s  "
+              f"speedup {baseline / elapsed:5.1f}x  "
+              f"picks {len(picks)}  errors {kinds}")
+
+    provider.slow = {symbols[2]: 3 * timeout}
+    _, _, errors = cold_run(universe, provider, 10, timeout)
+
+    print("error report (10 workers, one slow symbol):")
+    for symbol, error in sorted(errors.items()):
+        print(f"  {symbol}: {error}")
+
+
+if __name__ == "__main__":
+    main()
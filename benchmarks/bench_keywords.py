@@ -0,0 +1,97 @@
+"""
+Keyword matcher benchmark on 300 pages of synthetic report text.
+
+Compares KeywordMatcher with the per-keyword substring scans it
+replaced ("kw in text"), for the quarterly keyword set and for a
+200-keyword superset. Each set is timed on both matcher scans (the
+per-keyword find scan and the trie regex; the matcher picks by
+keyword count), for found() and for hits() with all positions.
+Also shows the word-boundary difference ("loss" vs "glossary").
+
+Run from the repository root:
+    python benchmarks/bench_keywords.py [--pages 300]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic_keywords import KeywordMatcher
+from logic_quarterly import QUARTERLY_MATCHER
+
+VOCABULARY = (
+    "the company reported revenue for the quarter with operating "
+    "performance across segments board approved dividend segment results "
+    "subsidiaries consolidated statement notes auditors glossary standalone "
+    "financial position cash flows employees capital expenditure plant region"
+).split()
+
+
+def report_text(pages, keywords, rng, words_per_page=500, keyword_rate=0.05):
+    """
+    Lowercased report text; about keyword_rate of pages carry one keyword.
+    """
+
+    out = []
+    for _ in range(pages):
+        words = [rng.choice(VOCABULARY) for _ in range(words_per_page)]
+        if rng.random() < keyword_rate:
+            words[rng.randrange(words_per_page)] = rng.choice(keywords)
+        out.append(" ".join(words))
+    return " ".join(out)
+
+
+def substring_scan(keywords, text):
+    return {k for k in keywords if k in text}
+
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=300)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    quarterly = list(QUARTERLY_MATCHER.keywords)
+    extra = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12)))
+        for _ in range(200)
+    ]
+
+    text = report_text(args.pages, quarterly, rng)
+    print(f"{args.pages} pages, {len(text):,} chars")
+
+    for keywords in (quarterly, quarterly + extra):
+        matcher = KeywordMatcher(keywords)
+        picked = "find" if matcher.scan else "regex"
+        substring = best_of(lambda: substring_scan(matcher.keywords, text))
+        print(f"{len(matcher.keywords)} keywords (matcher uses {picked}): "
+              f"substring scans {substring * 1e3:6.1f} ms")
+
+        for mode, scan in (("find", True), ("regex", False)):
+            matcher.scan = scan
+            found = best_of(lambda: matcher.found(text))
+            hits = best_of(lambda: matcher.hits(text))
+            print(f"  {mode:>5} scan: found {found * 1e3:6.1f} ms, "
+                  f"hits {hits * 1e3:6.1f} ms")
+
+    for sample in ("see the glossary", "net losses widened"):
+        print(f"'{sample}': substring {sorted(substring_scan(quarterly, sample))}, "
+              f"matcher {sorted(QUARTERLY_MATCHER.found(sample))}")
+
+
+if __name__ == "__main__":
+    main()
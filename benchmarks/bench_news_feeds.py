@@ -0,0 +1,111 @@
+"""
+News ingestion benchmark against a local RSS stub server.
+
+Starts an HTTP/1.1 server on localhost that serves one RSS feed per
+company with an ETag, Last-Modified and a fixed latency, points
+ADVISOR_NEWS_URL at it, and runs refresh_news_many over the Nifty 50
+companies twice. The cold run should get 200s; the warm run should
+get 304s only, over the same few keep-alive connections.
+
+Run from the repository root:
+    python benchmarks/bench_news_feeds.py [--latency 0.05]
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STATUS = Counter()
+CONNECTIONS = set()
+LATENCY = [0.05]
+
+
+def rss(query):
+    items = "".join(
+        f"<item><title>{query} profit rises {i}</title>"
+        f"<link>https://example.invalid/{i}</link><guid>{query}-{i}</guid>"
+        f"<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>"
+        for i in range(8)
+    )
+    return (
+        f'<?xml version="1.0"?><rss version="2.0"><channel>'
+        f"<title>{query}</title>{items}</channel></rss>"
+    ).encode()
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        CONNECTIONS.add(self.client_address)
+        query = parse_qs(urlparse(self.path).query)["q"][0]
+        body = rss(query)
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        time.sleep(LATENCY[0])
+
+        if self.headers.get("If-None-Match") == etag:
+            STATUS[304] += 1
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        STATUS[200] += 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    LATENCY[0] = args.latency
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Read at import time by logic_providers / logic_disk_cache
+    os.environ["ADVISOR_NEWS_URL"] = (
+        f"http://127.0.0.1:{server.server_port}/rss?q={{query}}"
+    )
+    os.environ["ADVISOR_CACHE_DIR"] = tempfile.mkdtemp(prefix="advisor-bench-")
+    os.environ.pop("ADVISOR_PROVIDER", None)
+
+    from logic_news import refresh_news_many
+    from logic_symbols import get_symbol_master
+
+    master = get_symbol_master()
+    companies = [master.company(s) for s in master.symbols]
+
+    for run in ("cold", "warm"):
+        STATUS.clear()
+        t0 = time.perf_counter()
+        results, errors = refresh_news_many(companies)
+        elapsed = time.perf_counter() - t0
+        print(f"{run}: {len(results)} feeds, {len(errors)} errors, "
+              f"{elapsed:.2f} s, status {dict(STATUS)}, "
+              f"connections so far {len(CONNECTIONS)}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Single-flight load test: N simulated sessions opening the same stock.
+
+Every session thread waits on a barrier, then requests CMP,
+fundamentals and news for one symbol at the same moment, against
+FakeProvider with a fixed latency. Prints provider calls per kind
+and the coalescing counters; with coalescing each kind should hit
+the provider once regardless of N.
+
+Run from the repository root:
+    python benchmarks/bench_singleflight.py [--sessions 40]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_provider import FakeProvider
+from logic_fundamentals import fetch_fundamentals
+from logic_news import fetch_news_entries
+from logic_providers import set_provider
+from logic_quotes import fetch_cmp
+from logic_singleflight import FLIGHTS
+from logic_symbols import get_symbol_master
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    master = get_symbol_master()
+    symbol = master.symbols[0]
+    company = master.company(symbol)
+
+    provider = FakeProvider(latency=args.latency)
+    set_provider(provider)
+
+    barrier = threading.Barrier(args.sessions)
+    results = [None] * args.sessions
+
+    def session(i):
+        barrier.wait()
+        results[i] = (
+            fetch_cmp(symbol),
+            fetch_fundamentals(symbol).to_dict(),
+            [item.title for item in fetch_news_entries(company)],
+        )
+
+    threads = [
+        threading.Thread(target=session, args=(i,))
+        for i in range(args.sessions)
+    ]
+
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    print(f"{args.sessions} sessions in {elapsed:.2f} s "
+          f"(provider latency {args.latency * 1e3:.0f} ms)")
+    print(f"provider calls: {dict(provider.calls)}")
+    print(f"coalescing: {FLIGHTS.stats()}")
+    print(f"identical results: {all(r == results[0] for r in results)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Ranking benchmark: streaming top_k vs collect + sort + slice.
+
+Synthetic scored candidates use coarse integer scores, so ties are
+common. Both methods must pick the same items in the same order.
+Time is measured over a prebuilt list (generation excluded); peak
+traced memory is measured while consuming a generator, which is
+how the goal advisor feeds candidates.
+
+Run from the repository root:
+    python benchmarks/bench_top_k.py [--rows 100000,2000000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from logic_ranking import top_k
+
+
+def candidates(n, seed=0):
+    rng = random.Random(seed)
+    for i in range(n):
+        yield (rng.randint(0, 150), f"SYM{i}")
+
+
+def by_sort(items, k):
+    return sorted(items, key=lambda c: c[0], reverse=True)[:k]
+
+
+def by_top_k(items, k):
+    return top_k(items, k, key=lambda c: c[0])
+
+
+def measure(fn, items, k):
+    n = len(items)
+    t0 = time.perf_counter()
+    result = fn(iter(items), k)
+    elapsed = time.perf_counter() - t0
+
+    tracemalloc.start()
+    fn(candidates(n), k)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="100000,2000000")
+    parser.add_argument("--k", default="3,7")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'k':>2}  {'sort':>9} {'peak':>9}  "
+          f"{'top_k':>9} {'peak':>9}  same")
+
+    for n in (int(r) for r in args.rows.split(",")):
+        items = list(candidates(n))
+        for k in (int(v) for v in args.k.split(",")):
+            expected, t_sort, m_sort = measure(by_sort, items, k)
+            got, t_top, m_top = measure(by_top_k, items, k)
+            print(f"{n:>10,} {k:>2}  {t_sort * 1e3:>6.0f} ms {m_sort / 1024:>6.0f} KB  "
+                  f"{t_top * 1e3:>6.0f} ms {m_top / 1024:>6.0f} KB  {got == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Deterministic in-memory market data provider for benchmarks.
+
+Every call sleeps `latency` seconds (plus per-symbol overrides in
+`slow`) and is counted; symbols in `failing` raise ConnectionError.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from logic_providers import MarketDataProvider, NewsItem
+
+
+def _seed(key):
+    return sum(ord(c) for c in key)
+
+
+class FakeProvider(MarketDataProvider):
+
+    def __init__(self, latency=0.1, failing=(), slow=None):
+        self.latency = latency
+        self.failing = set(failing)
+        self.slow = dict(slow or {})
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def _call(self, kind, key):
+        with self._lock:
+            self.calls[kind] += 1
+        time.sleep(self.slow.get(key, self.latency))
+        if key in self.failing:
+            raise ConnectionError(f"{kind} {key}: injected failure")
+
+    def quote(self, symbol):
+        self._call("quote", symbol)
+        return 100.0 + _seed(symbol) % 900
+
+    def quotes(self, symbols):
+        self._call("quotes", "*")
+        return {s: 100.0 + _seed(s) % 900 for s in symbols if s not in self.failing}
+
+    def info(self, symbol):
+        self._call("info", symbol)
+        n = _seed(symbol)
+        return {
+            "currentPrice": 100.0 + n % 900,
+            "trailingPE": 10 + n % 40,
+            "priceToBook": 1 + n % 7,
+            "enterpriseToEbitda": 6 + n % 20,
+            "returnOnEquity": (n % 30) / 100,
+            "profitMargins": (n % 20) / 100,
+            "debtToEquity": (n % 250) / 100,
+            "revenueGrowth": ((n % 35) - 5) / 100,
+            "earningsGrowth": ((n % 40) - 10) / 100,
+        }
+
+    def history(self, symbol, period="1d"):
+        self._call("history", symbol)
+        return pd.Series([100.0 + _seed(symbol) % 900])
+
+    def news(self, company, limit=5):
+        self._call("news", company)
+        return [
+            NewsItem(f"{company} reports strong growth {i}", f"https://example.invalid/{i}", "", f"{company}-{i}")
+            for i in range(limit)
+        ]
@@ -25,12 +25,14 @@ def ai_ask_why(
     reasons=None,
     risk_triggers=None,
     market=None,
-    portfolio_result=None
+    portfolio_result=None,
+    what_if=None
 ):
     """
     Main conversational entry point
 
     Parameters are passed explicitly so the AI never hallucinates.
+    what_if: optional recommendation-flip lines from logic_sensitivity
     """
 
     q = question.lower().strip()
@@ -78,7 +80,12 @@ def ai_ask_why(
     # -------------------------------
     # WHAT WOULD CHANGE THIS DECISION?
     # -------------------------------
-    if "change" in q or "invalidate" in q:
+    if "change" in q or "invalidate" in q or "what if" in q:
+        if what_if:
+            return (
+                "### Smallest changes that would flip this recommendation:\n"
+                + "\n".join(f"• {t}" for t in what_if)
+            )
         if risk_triggers:
             return (
                 "### This recommendation would change if:\n"
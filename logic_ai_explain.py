@@ -8,7 +8,8 @@ def ai_ask_why(
     reasons,
     risk_profile,
     market,
-    portfolio_mode=False
+    portfolio_mode=False,
+    what_if=None
 ):
     """
     Deterministic AI-style explanation engine.
@@ -49,6 +50,20 @@ def ai_ask_why(
             f"Market regime: **{market.get('regime', 'Neutral')}**"
         )
 
+    # ----------------------------------
+    # WHAT WOULD CHANGE THIS DECISION
+    # (only with a sensitivity scan; portfolio questions have none)
+    # ----------------------------------
+    elif what_if is not None and ("change" in q or "what if" in q):
+        if what_if:
+            response.append("Smallest changes that would flip this recommendation:")
+            for t in what_if:
+                response.append(f"• {t}")
+        else:
+            response.append(
+                "No single-metric change within the scanned range flips this recommendation."
+            )
+
     # ----------------------------------
     # CONFIDENCE QUESTION
     # ----------------------------------
@@ -80,6 +95,7 @@ def ai_ask_why(
             "You can ask things like:\n"
             "• Why is this a BUY?\n"
             "• What are the risks?\n"
+            "• What would change this recommendation?\n"
             "• How confident is this recommendation?"
         )
 
@@ -0,0 +1,114 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# ======================================================
+# CONCURRENT, BOUNDED BATCH FETCHING
+# ======================================================
+
+def _timed_call(fn, key, started):
+    started[key] = time.monotonic()
+    return fn(key)
+
+
+def fetch_concurrently(
+    keys,
+    fetch_fn,
+    max_workers=8,
+    timeout=10.0,
+    deadline=30.0
+):
+    """
+    Runs fetch_fn(key) for every key on a bounded thread pool.
+
+    Inputs:
+        keys: iterable of keys (e.g. symbols)
+        fetch_fn: callable taking one key
+        max_workers: concurrency limit
+        timeout: per-key limit (seconds), measured from when the
+                 call actually starts running
+        deadline: overall limit (seconds) for the whole batch
+
+    Returns:
+        results: {key: value} for calls that completed
+        errors: {key: {"error": str, "message": str, "elapsed": float}}
+                with error in "exception" | "timeout" | "deadline"
+
+    Calls that overrun are abandoned, not killed: their threads
+    finish in the background and their results are discarded.
+    """
+
+    keys = list(dict.fromkeys(keys))
+    results = {}
+    errors = {}
+
+    if not keys:
+        return results, errors
+
+    t0 = time.monotonic()
+    started = {}
+
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(keys))),
+        thread_name_prefix="batch-fetch"
+    )
+
+    futures = {
+        pool.submit(_timed_call, fetch_fn, k, started): k for k in keys
+    }
+    pending = set(futures)
+
+    try:
+        while pending:
+            now = time.monotonic()
+            remaining = deadline - (now - t0)
+
+            if remaining <= 0:
+                break
+
+            # Wake up no later than the next per-key timeout
+            next_timeout = min(
+                (started[futures[f]] + timeout - now
+                 for f in pending if futures[f] in started),
+                default=remaining
+            )
+            done, pending = wait(
+                pending,
+                timeout=max(0.0, min(remaining, next_timeout)),
+                return_when=FIRST_COMPLETED
+            )
+
+            for f in done:
+                key = futures[f]
+                elapsed = round(time.monotonic() - started.get(key, t0), 3)
+                try:
+                    results[key] = f.result()
+                except Exception as exc:
+                    errors[key] = {
+                        "error": "exception",
+                        "message": f"{type(exc).__name__}: {exc}",
+                        "elapsed": elapsed
+                    }
+
+            now = time.monotonic()
+            for f in list(pending):
+                key = futures[f]
+                if key in started and now - started[key] >= timeout:
+                    pending.discard(f)
+                    errors[key] = {
+                        "error": "timeout",
+                        "message": f"No result within {timeout}s",
+                        "elapsed": round(now - started[key], 3)
+                    }
+
+        for f in pending:
+            key = futures[f]
+            f.cancel()
+            errors[key] = {
+                "error": "deadline",
+                "message": f"Batch deadline of {deadline}s reached",
+                "elapsed": round(time.monotonic() - started.get(key, t0), 3)
+            }
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return results, errors
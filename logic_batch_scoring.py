@@ -0,0 +1,114 @@
+import numpy as np
+
+from logic_fundamentals_record import FIELDS, FundamentalsFrame
+from logic_rules import evaluate_frame
+from logic_scoring import MISMATCH_RULES, SCORE_RULES
+
+# ======================================================
+# VECTORIZED BATCH SCORING (EQUIVALENT TO score_stock)
+# ======================================================
+
+FUND_COLUMNS = list(FIELDS)
+
+# Reason bits, in the exact order score_stock appends them
+REASONS = (
+    [reason for _, _, reason in SCORE_RULES]
+    + [
+        "Positive news sentiment.",
+        "Negative news sentiment.",
+        "Risk disclosures noted in annual report.",
+    ]
+    + [f"⚠️ {warning}" for _, _, warning in MISMATCH_RULES]
+)
+
+NEWS_BIT = len(SCORE_RULES)
+ANNUAL_BIT = NEWS_BIT + 2
+MISMATCH_BIT = ANNUAL_BIT + 1
+
+
+def fundamentals_frame(funds, symbols=None):
+    """
+    Builds a columnar (float64, NaN = missing) FundamentalsFrame
+    from an iterable of Fundamentals records or dicts.
+    """
+
+    return FundamentalsFrame.from_records(funds, symbols)
+
+
+def _matches(value, label, n):
+    """
+    Boolean array: value == label, for a scalar or per-row value.
+    """
+    if value is None or isinstance(value, str):
+        return np.full(n, value == label)
+    return np.asarray(value, dtype=object) == label
+
+
+def score_batch(frame, risk_profile, news_bias=None, annual_risk=None):
+    """
+    Scores many stocks at once with array operations.
+
+    Inputs:
+        frame: FundamentalsFrame (or DataFrame) with FUND_COLUMNS,
+               NaN meaning "not available"
+        risk_profile: one profile for all rows, or one per row
+        news_bias: None, or "Positive" / "Neutral" / "Negative"
+                   (scalar or per row) — the news_summary["overall"]
+        annual_risk: None, or bool (scalar or per row) — whether the
+                     annual report mentions material risk / litigation
+
+    Returns:
+        scores: int64 array (0–100)
+        labels: object array of BUY / HOLD / AVOID
+        masks: int64 array of reason bits (see REASONS)
+
+    Results match score_stock row for row: both read the same
+    rule table, and missing (NaN) metrics never fire a rule.
+    """
+
+    n = len(frame)
+    score = np.full(n, 50, dtype=np.int64)
+    mask = np.zeros(n, dtype=np.int64)
+
+    def rule(cond, bit, delta):
+        score[cond] += delta
+        mask[cond] |= 1 << bit
+
+    flags = evaluate_frame(frame)
+
+    # Fundamental quality, growth & valuation (shared rule table)
+    for bit, (rule_id, delta, _) in enumerate(SCORE_RULES):
+        rule(flags[rule_id], bit, delta)
+
+    # News & annual report
+    rule(_matches(news_bias, "Positive", n), NEWS_BIT, 3)
+    rule(_matches(news_bias, "Negative", n), NEWS_BIT + 1, -4)
+
+    if annual_risk is not None:
+        rule(
+            np.broadcast_to(np.asarray(annual_risk, dtype=bool), (n,)),
+            ANNUAL_BIT, -4
+        )
+
+    # Risk profile mismatch (soft penalty)
+    mismatch = np.zeros(n, dtype=np.int64)
+    for bit, (rule_id, profile, _) in enumerate(MISMATCH_RULES, MISMATCH_BIT):
+        cond = _matches(risk_profile, profile, n) & flags[rule_id]
+        mask[cond] |= 1 << bit
+        mismatch += cond
+
+    score -= np.minimum(6, 2 * mismatch)
+    score = np.clip(score, 0, 100)
+
+    labels = np.where(score >= 70, "BUY", np.where(score >= 50, "HOLD", "AVOID"))
+
+    return score, labels.astype(object), mask
+
+
+def decode_reasons(mask):
+    """
+    Expands a reason bitmask into score_stock's reason strings.
+    """
+
+    mask = int(mask)
+    return [text for bit, text in enumerate(REASONS) if mask >> bit & 1]
@@ -0,0 +1,264 @@
+import threading
+import time
+
+from logic_disk_cache import STALENESS, get_disk_cache
+from logic_fundamentals import fundamentals_from_info
+from logic_news import NEWS_TTL, refresh_news_many
+from logic_quotes import fetch_quotes_bulk, store_quotes
+from logic_snapshot import SNAPSHOTS
+from logic_symbols import get_symbol_master
+
+# ======================================================
+# BACKGROUND CACHE WARMER (NIFTY 50 UNIVERSE)
+# ======================================================
+
+class RateBudget:
+    """
+    Token bucket shared by every warm-up request.
+    rate_per_sec tokens are added per second, up to burst.
+    """
+
+    def __init__(self, rate_per_sec=2.0, burst=5):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, stop_event=None, tokens=1):
+        """
+        Blocks until `tokens` tokens are available (or stop_event is
+        set). Returns False if stopped while waiting.
+        Requests larger than burst wait for a full bucket.
+        """
+
+        tokens = min(tokens, self.burst)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst,
+                    self._tokens + (now - self._stamp) * self.rate
+                )
+                self._stamp = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait_for = (tokens - self._tokens) / self.rate
+
+            if stop_event is not None:
+                if stop_event.wait(wait_for):
+                    return False
+            else:
+                time.sleep(wait_for)
+
+
+class CacheWarmer:
+    """
+    Refreshes quotes, fundamentals and news ahead of their expiry
+    for every symbol in the symbol master.
+
+    Every job (quotes for the whole universe, one info payload per
+    symbol, one news feed per company) is re-run after lead × TTL,
+    so page renders find fresh entries and never pay fetch latency.
+    Symbols marked visible are served first when several jobs are due.
+    """
+
+    def __init__(
+        self,
+        master=None,
+        rate_per_sec=2.0,
+        burst=5,
+        lead=0.8
+    ):
+        master = master or get_symbol_master()
+
+        self.symbols = master.symbols
+        self.companies = {s: master.company(s) for s in self.symbols}
+        self.budget = RateBudget(rate_per_sec, burst)
+        self.lead = lead
+
+        self.ttls = {
+            "quotes": STALENESS["quotes"]["*"],
+            "info": SNAPSHOTS.ttl,
+            "news": NEWS_TTL,
+        }
+
+        # (kind, symbol) -> monotonic due time
+        self._due = {("quotes", "*"): 0.0}
+        for s in self.symbols:
+            self._due[("info", s)] = 0.0
+            self._due[("news", s)] = 0.0
+
+        self.visible = set()
+        self.runs = 0
+        self.failures = 0
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -----------------------------
+    # Priority hints
+    # -----------------------------
+    def mark_visible(self, symbols):
+        """
+        Records the symbols currently on screen (served first).
+        """
+        with self._lock:
+            self.visible = set(symbols)
+
+    # -----------------------------
+    # Scheduling
+    # -----------------------------
+    def _next_job(self, now):
+        """
+        Returns (job, wait_seconds): a due job, or None and the
+        time until the earliest one becomes due.
+        """
+
+        with self._lock:
+            due = [
+                (job[1] not in self.visible and job[1] != "*", at, job)
+                for job, at in self._due.items() if at <= now
+            ]
+            if due:
+                return min(due)[2], 0.0
+            return None, max(0.0, min(self._due.values()) - now)
+
+    def _execute(self, kind, symbol):
+        if kind == "quotes":
+            # Per-symbol fallbacks spend budget like any other request
+            store_quotes(fetch_quotes_bulk(
+                self.symbols,
+                throttle=lambda cost: self.budget.acquire(self._stop, cost)
+            ))
+        elif kind == "info":
+            info = SNAPSHOTS.refresh(symbol)
+            if info:
+                get_disk_cache().put(
+                    "fundamentals", symbol, fundamentals_from_info(info).to_dict()
+                )
+
+    def _news_batch(self, first, now):
+        """
+        The due news job `first` plus other due news jobs (visible
+        symbols first), up to one budget burst in total.
+        """
+
+        with self._lock:
+            others = sorted(
+                (job[1] not in self.visible, at, job)
+                for job, at in self._due.items()
+                if job[0] == "news" and job != first and at <= now
+            )
+        return [first] + [job for _, _, job in others][:self.budget.burst - 1]
+
+    def _run_news(self, jobs):
+        """
+        Refreshes several companies' feeds concurrently (one pooled,
+        conditional-GET fetch each) and reschedules every job.
+        """
+
+        by_company = {self.companies[symbol]: (kind, symbol) for kind, symbol in jobs}
+        _, errors = refresh_news_many(list(by_company))
+
+        ttl = self.ttls["news"]
+        now = time.monotonic()
+
+        with self._lock:
+            for company, job in by_company.items():
+                failed = company in errors
+                self._due[job] = now + (
+                    min(ttl * self.lead, 60) if failed else ttl * self.lead
+                )
+            self.failures += len(errors)
+            self.runs += len(jobs)
+
+    def run_once(self):
+        """
+        Runs the next due job, if any. Returns True if one ran.
+        Due news jobs are batched into one concurrent refresh.
+        """
+
+        job, _ = self._next_job(time.monotonic())
+        if job is None:
+            return False
+
+        if job[0] == "news":
+            jobs = self._news_batch(job, time.monotonic())
+            if not self.budget.acquire(self._stop, len(jobs)):
+                return False
+            self._run_news(jobs)
+            return True
+
+        if not self.budget.acquire(self._stop):
+            return False
+
+        kind, symbol = job
+        ttl = self.ttls[kind]
+
+        try:
+            self._execute(kind, symbol)
+            delay = ttl * self.lead
+        except Exception:
+            self.failures += 1
+            delay = min(ttl * self.lead, 60)
+
+        self.runs += 1
+        with self._lock:
+            self._due[job] = time.monotonic() + delay
+
+        return True
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+    def _loop(self):
+        while not self._stop.is_set():
+            job, wait_for = self._next_job(time.monotonic())
+            if job is None:
+                self._stop.wait(min(wait_for, 5.0))
+                continue
+            self.run_once()
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._loop, name="cache-warmer", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def stats(self):
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "runs": self.runs,
+                "failures": self.failures,
+                "due_now": sum(1 for at in self._due.values() if at <= now),
+                "visible": len(self.visible)
+            }
+
+
+# ======================================================
+# SIDECAR ENTRY POINT
+# ======================================================
+
+if __name__ == "__main__":
+    # Sidecar mode shares only the on-disk caches (quotes and
+    # fundamentals) with the Streamlit process.
+    warmer = CacheWarmer().start()
+    try:
+        while True:
+            time.sleep(60)
+            print(warmer.stats(), flush=True)
+    except KeyboardInterrupt:
+        warmer.stop()
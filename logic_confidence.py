@@ -1,3 +1,5 @@
+from logic_rules import evaluate_rules, rule_view
+
 # ======================================================
 # CONFIDENCE, CONVICTION & RISK TRIGGERS
 # ======================================================
@@ -54,45 +56,32 @@ def conviction_label(rec, confidence, score):
 # STOCK-LEVEL RISK TRIGGERS (THESIS INVALIDATION)
 # ------------------------------------------------------
 
-def risk_triggers(fund, score, market=None):
-    """
-    Identifies conditions that could invalidate the investment thesis
-    """
-
-    triggers = []
-
-    # -----------------------------
+TRIGGER_RULES = rule_view([
     # Growth risks
-    # -----------------------------
-    if fund.get("RevenueGrowth") is not None and fund["RevenueGrowth"] < 0.08:
-        triggers.append("Revenue growth falls below 8%")
-
-    if fund.get("EPSGrowth") is not None and fund["EPSGrowth"] < 0.10:
-        triggers.append("Earnings growth weakens below 10%")
-
-    # -----------------------------
+    ("RevenueGrowth<0.08", "Revenue growth falls below 8%"),
+    ("EPSGrowth<0.1", "Earnings growth weakens below 10%"),
     # Leverage & balance sheet
-    # -----------------------------
-    if fund.get("DebtEquity") is not None and fund["DebtEquity"] > 1.5:
-        triggers.append("Debt-to-equity rises above comfortable levels")
+    ("DebtEquity>1.5", "Debt-to-equity rises above comfortable levels"),
+    ("InterestCover<2", "Interest coverage weakens below 2×"),
+    # Profitability pressure
+    ("ROCE<0.12", "Return on capital falls below 12%"),
+    ("NetMargin<0.08", "Net profit margin compresses below 8%"),
+    # Valuation risk
+    ("PE>40", "Valuation expands beyond reasonable PE levels"),
+])
 
-    if fund.get("InterestCover") is not None and fund["InterestCover"] < 2:
-        triggers.append("Interest coverage weakens below 2×")
 
-    # -----------------------------
-    # Profitability pressure
-    # -----------------------------
-    if fund.get("ROCE") is not None and fund["ROCE"] < 0.12:
-        triggers.append("Return on capital falls below 12%")
+def risk_triggers(fund, score, market=None):
+    """
+    Identifies conditions that could invalidate the investment thesis
+    """
 
-    if fund.get("NetMargin") is not None and fund["NetMargin"] < 0.08:
-        triggers.append("Net profit margin compresses below 8%")
+    fired = evaluate_rules(fund)
 
     # -----------------------------
-    # Valuation risk
+    # Fundamentals (rule table)
     # -----------------------------
-    if fund.get("PE") is not None and fund["PE"] > 40:
-        triggers.append("Valuation expands beyond reasonable PE levels")
+    triggers = [text for rule, text in TRIGGER_RULES if rule in fired]
 
     # -----------------------------
     # Score deterioration
@@ -0,0 +1,302 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# ======================================================
+# PERSISTENT DISK CACHE (SQLITE)
+# ======================================================
+
+CACHE_DIR = os.environ.get("ADVISOR_CACHE_DIR", ".cache")
+CACHE_PATH = os.path.join(CACHE_DIR, "advisor_cache.sqlite")
+
+# Per-field staleness windows (seconds).
+# "*" is the default for fields not listed explicitly.
+STALENESS = {
+    "fundamentals": {
+        "PE": 86400,
+        "PB": 86400,
+        "EV_EBITDA": 86400,
+        "*": 7 * 86400,
+    },
+    "quotes": {
+        "*": 300,
+    },
+    # Figures read from a company's own filings, timed from the end
+    # of the quarter they report: results follow within ~45 days,
+    # so they hold until the next quarter's results are due
+    "reported": {
+        "*": 135 * 86400,
+    },
+}
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache that survives process restarts.
+
+    Entries are dicts of fields; every field keeps its own fetch
+    timestamp so staleness can be judged per field. Writes are
+    single transactions (atomic) and the table is bounded by
+    evicting least-recently-read entries.
+    """
+
+    def __init__(self, path=CACHE_PATH, max_entries=5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._init_lock = threading.Lock()
+        self._ready = False
+
+    # -----------------------------
+    # Connection handling
+    # -----------------------------
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        if not self._ready:
+            with self._init_lock:
+                if not self._ready:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS entries ("
+                        " namespace TEXT NOT NULL,"
+                        " key TEXT NOT NULL,"
+                        " payload TEXT NOT NULL,"
+                        " fetched TEXT NOT NULL,"
+                        " accessed_at REAL NOT NULL,"
+                        " PRIMARY KEY (namespace, key))"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_entries_accessed"
+                        " ON entries (accessed_at)"
+                    )
+                    self._ready = True
+        return conn
+
+    # -----------------------------
+    # Reads
+    # -----------------------------
+    def get_many(self, namespace, keys):
+        """
+        Returns {key: (payload, fetched)} for keys present on disk.
+        fetched maps each field to its fetch timestamp (epoch secs).
+        """
+
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        found = {}
+        conn = self._connect()
+        try:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, payload, fetched FROM entries"
+                    f" WHERE namespace = ? AND key IN ({marks})",
+                    [namespace] + chunk
+                ).fetchall()
+                for key, payload, fetched in rows:
+                    found[key] = (json.loads(payload), json.loads(fetched))
+
+                conn.execute(
+                    f"UPDATE entries SET accessed_at = ?"
+                    f" WHERE namespace = ? AND key IN ({marks})",
+                    [time.time(), namespace] + chunk
+                )
+        except sqlite3.Error:
+            return found
+        finally:
+            conn.close()
+
+        return found
+
+    def get(self, namespace, key):
+        return self.get_many(namespace, [key]).get(key)
+
+    # -----------------------------
+    # Writes
+    # -----------------------------
+    def put_many(self, namespace, items, fetched_at=None):
+        """
+        Merges {key: fields_dict} into the cache in one transaction.
+        Only the fields supplied get a fresh timestamp (fetched_at,
+        default now, for data whose age is known from its source).
+        """
+
+        if not items:
+            return
+
+        now = time.time()
+        stamp = now if fetched_at is None else fetched_at
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for key, fields in items.items():
+                row = conn.execute(
+                    "SELECT payload, fetched FROM entries"
+                    " WHERE namespace = ? AND key = ?",
+                    (namespace, key)
+                ).fetchone()
+                payload, fetched = ({}, {}) if row is None else (
+                    json.loads(row[0]), json.loads(row[1])
+                )
+                payload.update(fields)
+                fetched.update({f: stamp for f in fields})
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries"
+                    " (namespace, key, payload, fetched, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (namespace, key, json.dumps(payload),
+                     json.dumps(fetched), now)
+                )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            try:
+                conn.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+        finally:
+            conn.close()
+
+    def put(self, namespace, key, fields, fetched_at=None):
+        self.put_many(namespace, {key: fields}, fetched_at)
+
+    def _evict(self, conn):
+        count = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM entries WHERE rowid IN ("
+                " SELECT rowid FROM entries"
+                " ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            )
+
+    def clear(self, namespace=None):
+        conn = self._connect()
+        try:
+            if namespace is None:
+                conn.execute("DELETE FROM entries")
+            else:
+                conn.execute(
+                    "DELETE FROM entries WHERE namespace = ?", (namespace,)
+                )
+        finally:
+            conn.close()
+
+
+# ======================================================
+# STALENESS HELPERS
+# ======================================================
+
+def stale_fields(namespace, payload, fetched, now=None, fields=None):
+    """
+    Returns the fields of a cached entry that are past their window.
+
+    fields: the fields the caller needs (default: those cached).
+            Needed fields missing from the entry count as stale.
+    """
+
+    now = time.time() if now is None else now
+    windows = STALENESS.get(namespace, {})
+    default = windows.get("*", 0)
+
+    return [
+        f for f in (payload if fields is None else fields)
+        if f not in payload or now - fetched.get(f, 0) > windows.get(f, default)
+    ]
+
+
+# ======================================================
+# STALE-WHILE-REVALIDATE
+# ======================================================
+
+DISK_CACHE = None
+_cache_lock = threading.Lock()
+
+_refresher = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def get_disk_cache():
+    """
+    Returns the process-wide DiskCache, creating its directory lazily.
+    """
+    global DISK_CACHE
+
+    with _cache_lock:
+        if DISK_CACHE is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            DISK_CACHE = DiskCache()
+        return DISK_CACHE
+
+
+def submit_refresh(token, job):
+    """
+    Runs job() on the refresh pool unless the same token is in flight.
+    """
+
+    with _refreshing_lock:
+        if token in _refreshing:
+            return
+        _refreshing.add(token)
+
+    def run():
+        try:
+            job()
+        except Exception:
+            pass
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(token)
+
+    _refresher.submit(run)
+
+
+def refresh_in_background(namespace, key, loader):
+    """
+    Schedules loader() and stores its result, once per key at a time.
+    """
+
+    def job():
+        value = loader()
+        if value is not None:
+            get_disk_cache().put(namespace, key, value)
+
+    submit_refresh((namespace, key), job)
+
+
+def cached_fetch(namespace, key, loader, fields=None):
+    """
+    Serves key from disk, refreshing stale entries in the background.
+
+    Inputs:
+        namespace: cache namespace (see STALENESS)
+        key: entry key (e.g. symbol)
+        loader: zero-arg callable returning a fields dict,
+                or None when the fetch failed (not cached)
+        fields: fields the caller needs; an entry missing any of
+                them is refreshed (default: the cached fields)
+
+    Returns:
+        fields dict or None
+    """
+
+    cache = get_disk_cache()
+    entry = cache.get(namespace, key)
+
+    if entry is not None:
+        payload, fetched = entry
+        if stale_fields(namespace, payload, fetched, fields=fields):
+            refresh_in_background(namespace, key, loader)
+        return payload
+
+    value = loader()
+    if value is not None:
+        cache.put(namespace, key, value)
+    return value
@@ -0,0 +1,133 @@
+import threading
+import time
+
+# ======================================================
+# NEGATIVE-RESULT CACHING & CIRCUIT BREAKER
+# ======================================================
+
+class FailureTracker:
+    """
+    Tracks failed fetches per key (e.g. ("cmp", "M&M")).
+
+    - Each consecutive failure blocks retries for a negative TTL
+      that doubles from base_ttl up to max_ttl.
+    - After breaker_threshold consecutive failures the key is
+      quarantined (breaker "open") for breaker_cooldown seconds,
+      then a single probe is allowed ("half-open"); a caller that
+      does not make the probe must release() it.
+    - Any success resets the key.
+    """
+
+    def __init__(
+        self,
+        base_ttl=15,
+        max_ttl=600,
+        breaker_threshold=5,
+        breaker_cooldown=1800
+    ):
+        self.base_ttl = base_ttl
+        self.max_ttl = max_ttl
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.skipped = 0
+
+    def _state(self, entry, now):
+        if entry["failures"] >= self.breaker_threshold:
+            if now < entry["retry_at"]:
+                return "open"
+            return "probing" if entry["probing"] else "half-open"
+        if now < entry["retry_at"]:
+            return "backoff"
+        return "closed"
+
+    def should_skip(self, key):
+        """
+        True when key is negative-cached or quarantined.
+        A half-open key lets exactly one caller through as a probe.
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+
+            state = self._state(entry, now)
+            if state == "half-open":
+                entry["probing"] = True
+                return False
+            if state in ("open", "probing", "backoff"):
+                self.skipped += 1
+                return True
+            return False
+
+    def release(self, key):
+        """
+        Ends a probe that was let through but never made (e.g. the
+        caller was throttled), so the next caller can probe instead.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["probing"] = False
+
+    def record_success(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def record_failure(self, key):
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.setdefault(
+                key, {"failures": 0, "retry_at": 0.0, "probing": False}
+            )
+            entry["failures"] += 1
+            entry["probing"] = False
+
+            if entry["failures"] >= self.breaker_threshold:
+                delay = self.breaker_cooldown
+            else:
+                delay = min(
+                    self.max_ttl,
+                    self.base_ttl * 2 ** (entry["failures"] - 1)
+                )
+            entry["retry_at"] = now + delay
+
+    def snapshot(self):
+        """
+        Returns one row per failing key, worst first:
+        {kind, symbol, failures, state, retry_in_s}
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            rows = [
+                {
+                    "kind": key[0],
+                    "symbol": key[1],
+                    "failures": entry["failures"],
+                    "state": self._state(entry, now),
+                    "retry_in_s": max(0, round(entry["retry_at"] - now)),
+                }
+                for key, entry in self._entries.items()
+            ]
+
+        return sorted(rows, key=lambda r: (-r["failures"], r["symbol"]))
+
+    def quarantined(self):
+        """
+        Returns keys whose circuit breaker is currently open.
+        """
+        return [
+            (r["kind"], r["symbol"]) for r in self.snapshot()
+            if r["state"] in ("open", "probing")
+        ]
+
+
+FAILURES = FailureTracker()
@@ -0,0 +1,87 @@
+import threading
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+
+# ======================================================
+# RSS FEED CLIENT (KEEP-ALIVE POOL + CONDITIONAL GET)
+# ======================================================
+
+class FeedClient:
+    """
+    Fetches RSS / Atom feeds over one shared requests.Session.
+
+    - Connections are kept alive and pooled (pool_size per host),
+      so concurrent fetches reuse sockets instead of reconnecting.
+    - The ETag / Last-Modified of each URL is remembered and sent
+      back as If-None-Match / If-Modified-Since. An unchanged feed
+      answers 304 and its previously parsed entries are returned.
+    """
+
+    def __init__(self, pool_size=16, timeout=10.0, session=None):
+        self.timeout = timeout
+        self.session = session or requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.setdefault("User-Agent", feedparser.USER_AGENT)
+
+        # url -> (etag, last_modified, entries)
+        self._validators = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "not_modified": 0, "bytes": 0}
+
+    def fetch(self, url):
+        """
+        Returns the feed's entries (list of feedparser entries).
+        Raises on transport errors and non-2xx / 304 responses.
+        """
+
+        with self._lock:
+            cached = self._validators.get(url)
+
+        headers = {}
+        if cached:
+            etag, modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bytes"] += len(response.content)
+
+        if response.status_code == 304 and cached:
+            with self._lock:
+                self._stats["not_modified"] += 1
+            return cached[2]
+
+        response.raise_for_status()
+
+        entries = feedparser.parse(
+            response.content,
+            response_headers={k.lower(): v for k, v in response.headers.items()}
+        ).entries
+
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+
+        with self._lock:
+            if etag or modified:
+                self._validators[url] = (etag, modified, entries)
+            else:
+                self._validators.pop(url, None)
+
+        return entries
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, validators=len(self._validators))
+
+
+FEEDS = FeedClient()
@@ -1,4 +1,10 @@
-import yfinance as yf
+from datetime import datetime
+
+from logic_disk_cache import cached_fetch, get_disk_cache, stale_fields
+from logic_fundamentals_record import FIELDS, Fundamentals
+from logic_rules import evaluate_rules, rule_view
+from logic_singleflight import coalesce
+from logic_snapshot import get_ticker_info
 
 # ======================================================
 # SAFETY HELPERS
@@ -23,32 +29,127 @@ def safe_num(val, default=None):
 # FUNDAMENTALS FETCH (YAHOO FINANCE)
 # ======================================================
 
+def fundamentals_from_info(info):
+    """
+    Maps a raw Yahoo info payload onto a Fundamentals record.
+    No fallbacks are applied here.
+    """
+
+    return Fundamentals(
+        PE=safe_num(info.get("trailingPE")),
+        PB=safe_num(info.get("priceToBook")),
+        EV_EBITDA=safe_num(info.get("enterpriseToEbitda")),
+        ROE=safe_num(info.get("returnOnEquity")),
+        ROCE=safe_num(info.get("returnOnCapitalEmployed")),
+        NetMargin=safe_num(info.get("profitMargins")),
+        DebtEquity=safe_num(info.get("debtToEquity")),
+        InterestCover=safe_num(info.get("interestCoverage")),
+        RevenueGrowth=safe_num(info.get("revenueGrowth")),
+        EPSGrowth=safe_num(info.get("earningsGrowth")),
+    )
+
+
 def fetch_fundamentals(symbol):
     """
     Fetches company fundamentals from Yahoo Finance.
-    Returns ONLY numeric-safe values (float or None).
+    Reads the shared ticker snapshot instead of its own .info call.
+    Concurrent calls for the same symbol share one fetch.
+    Returns a frozen Fundamentals record with fallbacks applied.
     """
 
-    try:
-        ticker = yf.Ticker(symbol + ".NS")
-        info = ticker.info or {}
-    except Exception:
-        info = {}
-
-    fund = {
-        "PE": safe_num(info.get("trailingPE")),
-        "PB": safe_num(info.get("priceToBook")),
-        "EV_EBITDA": safe_num(info.get("enterpriseToEbitda")),
-        "ROE": safe_num(info.get("returnOnEquity")),
-        "ROCE": safe_num(info.get("returnOnCapitalEmployed")),
-        "NetMargin": safe_num(info.get("profitMargins")),
-        "DebtEquity": safe_num(info.get("debtToEquity")),
-        "InterestCover": safe_num(info.get("interestCoverage")),
-        "RevenueGrowth": safe_num(info.get("revenueGrowth")),
-        "EPSGrowth": safe_num(info.get("earningsGrowth")),
-    }
+    def load():
+        info = get_ticker_info(symbol)
+        return fundamentals_from_info(info).with_fallbacks()
+
+    return coalesce("fundamentals", symbol, load)
+
+
+def fetch_fundamentals_cached(symbol, fallbacks=True):
+    """
+    Disk-cached variant of fetch_fundamentals.
+
+    Serves the last stored fundamentals immediately (even after a
+    process restart) and refreshes stale fields in the background.
+    Failed fetches are never written to disk; when nothing is cached
+    and the fetch fails, LookupError is raised instead of returning
+    an all-None record.
+
+    Fresh figures from the company's own filings (see
+    store_reported_fundamentals) take priority over .info values,
+    and those fields alone never trigger a network refresh.
+
+    Pass fallbacks=False to get the raw record, e.g. when fallbacks
+    are applied once over a whole FundamentalsFrame.
+    """
+
+    def load():
+        info = get_ticker_info(symbol)
+        return fundamentals_from_info(info).to_dict() if info else None
+
+    reported = reported_fundamentals(symbol)
+    needed = [f for f in FIELDS if f not in reported]
+
+    raw = coalesce(
+        "fundamentals_cached", symbol,
+        lambda: cached_fetch("fundamentals", symbol, load, fields=needed)
+    )
+
+    if raw is None:
+        raise LookupError(f"No fundamentals available for {symbol}")
+
+    fund = Fundamentals.from_mapping({**raw, **reported})
+
+    return fund.with_fallbacks() if fallbacks else fund
+
+
+def store_reported_fundamentals(symbol, values, period_end):
+    """
+    Persists fundamentals read from a company's own filings (e.g. a
+    quarterly results PDF) under the "reported" disk namespace.
+
+    They are kept apart from .info payloads, so background refreshes
+    and the cache warmer never overwrite them, and they override the
+    .info values in fetch_fundamentals_cached until they go stale.
+    Their age runs from period_end (the reported quarter's end date),
+    not from the upload, so an old filing is never stored as fresh,
+    nor over the figures of a later quarter.
+    Only call this once the filing is known to be the symbol's own.
+
+    Returns True when the figures were stored.
+    """
+
+    if not values or period_end is None:
+        return False
+
+    stamp = datetime.combine(period_end, datetime.min.time()).timestamp()
+    if stale_fields("reported", values, {f: stamp for f in values}):
+        return False
 
-    return apply_fundamental_fallbacks(fund)
+    cache = get_disk_cache()
+    entry = cache.get("reported", symbol)
+    if entry is not None and max(entry[1].values(), default=0) > stamp:
+        return False
+
+    cache.put("reported", symbol, dict(values), fetched_at=stamp)
+    return True
+
+
+def reported_fundamentals(symbol):
+    """
+    {field: value} of the symbol's reported figures still in date.
+    """
+
+    entry = get_disk_cache().get("reported", symbol)
+    if entry is None:
+        return {}
+
+    payload, fetched = entry
+    stale = set(stale_fields("reported", payload, fetched))
+
+    return {
+        f: v for f, v in payload.items()
+        if f in FIELDS and f not in stale and v is not None
+    }
 
 
 # ======================================================
@@ -59,33 +160,16 @@ def apply_fundamental_fallbacks(fund):
     """
     Conservative rule-based fallbacks.
     Prevents None values from breaking scoring & UI.
-    """
-
-    # ROCE ↔ ROE inference
-    if fund.get("ROCE") is None and fund.get("ROE") is not None:
-        fund["ROCE"] = round(fund["ROE"] * 0.8, 3)
-
-    if fund.get("ROE") is None and fund.get("ROCE") is not None:
-        fund["ROE"] = round(fund["ROCE"] * 0.9, 3)
 
-    # Net margin proxy
-    if fund.get("NetMargin") is None and fund.get("ROE") is not None:
-        fund["NetMargin"] = round(fund["ROE"] * 0.35, 3)
-
-    # Interest coverage proxy
-    if fund.get("InterestCover") is None:
-        if fund.get("DebtEquity") is not None:
-            fund["InterestCover"] = max(1.0, 5 - fund["DebtEquity"] * 2)
-        else:
-            fund["InterestCover"] = 2.0
-
-    # Growth defaults (very conservative)
-    if fund.get("RevenueGrowth") is None:
-        fund["RevenueGrowth"] = 0.05
+    Records are immutable, so a new record is returned; plain dicts
+    are still filled in place. The rules themselves live in
+    logic_fundamentals_record.fallback_columns (vectorized).
+    """
 
-    if fund.get("EPSGrowth") is None:
-        fund["EPSGrowth"] = fund["RevenueGrowth"]
+    if isinstance(fund, Fundamentals):
+        return fund.with_fallbacks()
 
+    fund.update(Fundamentals.from_mapping(fund).with_fallbacks().items())
     return fund
 
 
@@ -93,6 +177,20 @@ def apply_fundamental_fallbacks(fund):
 # METRIC QUALITY LABELING
 # ======================================================
 
+# metric -> (healthy rule, watch rule, label when neither fires)
+METRIC_BANDS = {
+    "ROE": ("ROE>=0.15", "ROE>=0.1", "🔴 Weak"),
+    "ROCE": ("ROCE>=0.15", "ROCE>=0.1", "🔴 Weak"),
+    "DebtEquity": ("DebtEquity<=1", "DebtEquity<=2", "🔴 Risky"),
+    "InterestCover": ("InterestCover>=3", "InterestCover>=1.5", "🔴 Weak"),
+    "PE": ("PE<=25", "PE<=40", "🔴 Risky"),
+    "RevenueGrowth": ("RevenueGrowth>=0.1", "RevenueGrowth>=0.05", "🔴 Weak"),
+    "EPSGrowth": ("EPSGrowth>=0.1", "EPSGrowth>=0.05", "🔴 Weak"),
+}
+
+rule_view([rule for band in METRIC_BANDS.values() for rule in band[:2]])
+
+
 def evaluate_metric(metric, value):
     """
     Labels a metric as Healthy / Watch / Weak / Not Available
@@ -101,67 +199,39 @@ def evaluate_metric(metric, value):
     if value is None:
         return "⚪ Not Available"
 
-    thresholds = {
-        "ROE": (0.15, 0.10),
-        "ROCE": (0.15, 0.10),
-        "DebtEquity": (1.0, 2.0),
-        "InterestCover": (3.0, 1.5),
-        "PE": (25, 40),
-        "RevenueGrowth": (0.10, 0.05),
-        "EPSGrowth": (0.10, 0.05),
-    }
-
-    if metric not in thresholds:
+    if metric not in METRIC_BANDS:
         return "⚪ Neutral"
 
-    good, weak = thresholds[metric]
-
-    # Inverse metrics
-    if metric in ["DebtEquity", "PE"]:
-        if value <= good:
-            return "🟢 Healthy"
-        elif value <= weak:
-            return "🟡 Watch"
-        else:
-            return "🔴 Risky"
+    healthy, watch, weak_label = METRIC_BANDS[metric]
+    fired = evaluate_rules({metric: value})
 
-    # Normal metrics
-    if value >= good:
+    if healthy in fired:
         return "🟢 Healthy"
-    elif value >= weak:
+    if watch in fired:
         return "🟡 Watch"
-    else:
-        return "🔴 Weak"
+    return weak_label
 
 
 # ======================================================
 # RED FLAG DETECTION (NUMERIC SAFE)
 # ======================================================
 
+RED_FLAG_RULES = rule_view([
+    ("InterestCover<1.5", "Low interest coverage"),
+    ("DebtEquity>2", "High leverage"),
+    ("ROE<0.1", "Weak return on equity"),
+    ("NetMargin<0.05", "Thin profit margins"),
+    ("RevenueGrowth<0", "Negative revenue growth"),
+    ("EPSGrowth<0", "Negative earnings growth"),
+])
+
+
 def detect_red_flags(fund):
     """
     Identifies fundamental red flags.
     Returns a list of human-readable warnings.
     """
 
-    flags = []
-
-    if fund.get("InterestCover") is not None and fund["InterestCover"] < 1.5:
-        flags.append("Low interest coverage")
-
-    if fund.get("DebtEquity") is not None and fund["DebtEquity"] > 2:
-        flags.append("High leverage")
-
-    if fund.get("ROE") is not None and fund["ROE"] < 0.10:
-        flags.append("Weak return on equity")
-
-    if fund.get("NetMargin") is not None and fund["NetMargin"] < 0.05:
-        flags.append("Thin profit margins")
-
-    if fund.get("RevenueGrowth") is not None and fund["RevenueGrowth"] < 0:
-        flags.append("Negative revenue growth")
-
-    if fund.get("EPSGrowth") is not None and fund["EPSGrowth"] < 0:
-        flags.append("Negative earnings growth")
+    fired = evaluate_rules(fund)
 
-    return flags
+    return [flag for rule, flag in RED_FLAG_RULES if rule in fired]
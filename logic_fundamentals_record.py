@@ -0,0 +1,277 @@
+import numpy as np
+import pandas as pd
+
+# ======================================================
+# FUNDAMENTALS RECORD & UNIVERSE FRAME
+# ======================================================
+# Fundamentals (one stock): frozen __slots__ record, float or None.
+# FundamentalsFrame (many stocks): struct-of-arrays, one float64
+# column per field, NaN = missing.
+#
+# Both keep the read-only dict API (get / [] / keys / items), so
+# every rule, scoring and UI helper accepts either.
+
+FIELDS = (
+    "PE", "PB", "EV_EBITDA", "ROE", "ROCE", "NetMargin",
+    "DebtEquity", "InterestCover", "RevenueGrowth", "EPSGrowth"
+)
+
+_FIELD_INDEX = {f: i for i, f in enumerate(FIELDS)}
+
+
+def _clean(value):
+    """
+    float, or None for missing / NaN values.
+    """
+    if value is None:
+        return None
+    value = float(value)
+    return None if value != value else value
+
+
+class Fundamentals:
+    """
+    Immutable fundamentals for one stock.
+
+    Being frozen, a record is shared instead of copied: caches,
+    coalesced fetches and the UI all hold the same object.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, **values):
+        unknown = set(values) - set(FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown fundamentals fields: {sorted(unknown)}")
+
+        for field in FIELDS:
+            object.__setattr__(self, field, _clean(values.get(field)))
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """
+        Builds a record from any mapping, ignoring unknown keys.
+        """
+        return cls(**{f: mapping.get(f) for f in FIELDS})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Fundamentals records are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Fundamentals records are immutable")
+
+    # -----------------------------
+    # Read-only dict API
+    # -----------------------------
+    def get(self, key, default=None):
+        if key in _FIELD_INDEX:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        if key not in _FIELD_INDEX:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in _FIELD_INDEX
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def keys(self):
+        return FIELDS
+
+    def values(self):
+        return tuple(getattr(self, f) for f in FIELDS)
+
+    def items(self):
+        return tuple((f, getattr(self, f)) for f in FIELDS)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    # -----------------------------
+    # Value semantics
+    # -----------------------------
+    def replace(self, **changes):
+        """
+        Returns a new record with some fields changed.
+        """
+        values = self.to_dict()
+        values.update(changes)
+        return Fundamentals(**values)
+
+    def with_fallbacks(self):
+        """
+        Returns a new record with conservative fallbacks applied
+        (same rules as FundamentalsFrame.with_fallbacks).
+        """
+        filled = fallback_columns(
+            {f: np.array([np.nan if v is None else v]) for f, v in self.items()}
+        )
+        return Fundamentals(**{f: filled[f][0] for f in FIELDS})
+
+    def __eq__(self, other):
+        if isinstance(other, Fundamentals):
+            return self.values() == other.values()
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.values())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Fundamentals.from_mapping, (self.to_dict(),))
+
+    def __repr__(self):
+        body = ", ".join(f"{f}={getattr(self, f)!r}" for f in FIELDS)
+        return f"Fundamentals({body})"
+
+
+# ======================================================
+# VECTORIZED FALLBACKS (SINGLE DEFINITION)
+# ======================================================
+
+def _round3(values):
+    """
+    Vectorized round(x, 3) that agrees with Python's correctly
+    rounded round(): near-ties are re-rounded element by element.
+    """
+
+    rounded = np.round(values, 3)
+    frac = np.abs(values * 1000 % 1 - 0.5)
+    ties = np.flatnonzero(frac < 1e-6)
+    if ties.size:
+        rounded = rounded.copy()
+        rounded.flat[ties] = [round(float(v), 3) for v in values.flat[ties]]
+    return rounded
+
+
+def fallback_columns(columns):
+    """
+    Conservative rule-based fallbacks over whole columns.
+    Only NaN (missing) cells are filled; inputs are not modified.
+    """
+
+    c = dict(columns)
+
+    def fill(field, compute):
+        # compute(missing) only sees the rows that need a value
+        column = c[field]
+        missing = np.isnan(column)
+        if missing.any():
+            column = column.copy()
+            column[missing] = compute(missing)
+            c[field] = column
+
+    with np.errstate(invalid="ignore"):
+        # ROCE ↔ ROE inference
+        fill("ROCE", lambda m: _round3(c["ROE"][m] * 0.8))
+        fill("ROE", lambda m: _round3(c["ROCE"][m] * 0.9))
+
+        # Net margin proxy
+        fill("NetMargin", lambda m: _round3(c["ROE"][m] * 0.35))
+
+        # Interest coverage proxy
+        fill("InterestCover", lambda m: np.where(
+            np.isnan(c["DebtEquity"][m]),
+            2.0,
+            np.maximum(1.0, 5 - c["DebtEquity"][m] * 2)
+        ))
+
+        # Growth defaults (very conservative)
+        fill("RevenueGrowth", lambda m: 0.05)
+        fill("EPSGrowth", lambda m: c["RevenueGrowth"][m])
+
+    return c
+
+
+# ======================================================
+# UNIVERSE FRAME (STRUCT OF ARRAYS)
+# ======================================================
+
+class FundamentalsFrame:
+    """
+    Fundamentals for many stocks as one float64 column per field.
+
+    frame["ROE"]   → float64 column (NaN = missing)
+    frame.missing  → bool (n × fields) NaN mask
+    frame.record(i) / frame.records() → Fundamentals rows
+
+    Works anywhere a DataFrame of fundamentals was accepted
+    (score_batch, evaluate_frame): len(), `in` and [] by field.
+    """
+
+    __slots__ = ("symbols", "_values")
+
+    def __init__(self, columns, symbols=None):
+        n = len(next(iter(columns.values()))) if columns else 0
+        values = np.full((n, len(FIELDS)), np.nan, order="F")
+
+        for field, column in columns.items():
+            if field in _FIELD_INDEX:
+                values[:, _FIELD_INDEX[field]] = column
+
+        self._values = values
+        self.symbols = list(symbols) if symbols is not None else None
+
+    @classmethod
+    def from_records(cls, records, symbols=None):
+        """
+        Builds a frame from Fundamentals records or plain dicts.
+        """
+
+        rows = [[r.get(f) for f in FIELDS] for r in records]
+        values = np.array(rows, dtype="float64").reshape(-1, len(FIELDS))
+
+        frame = cls.__new__(cls)
+        frame._values = np.asfortranarray(values)
+        frame.symbols = list(symbols) if symbols is not None else None
+        return frame
+
+    def __len__(self):
+        return self._values.shape[0]
+
+    def __contains__(self, field):
+        return field in _FIELD_INDEX
+
+    def __getitem__(self, field):
+        return self._values[:, _FIELD_INDEX[field]]
+
+    def columns(self):
+        return {f: self[f] for f in FIELDS}
+
+    @property
+    def missing(self):
+        return np.isnan(self._values)
+
+    @property
+    def nbytes(self):
+        return self._values.nbytes
+
+    def with_fallbacks(self):
+        """
+        Returns a new frame with fallbacks applied to every row at once.
+        """
+        return FundamentalsFrame(fallback_columns(self.columns()), self.symbols)
+
+    def record(self, i):
+        return Fundamentals(**dict(zip(FIELDS, self._values[i].tolist())))
+
+    def records(self):
+        for row in self._values.tolist():
+            yield Fundamentals(**dict(zip(FIELDS, row)))
+
+    def to_pandas(self):
+        return pd.DataFrame(
+            self._values, columns=list(FIELDS), index=self.symbols
+        )
@@ -1,6 +1,9 @@
 # logic_goal_based_advisor.py
 
-from logic_scoring import score_stock
+from logic_batch_fetch import fetch_concurrently
+from logic_batch_scoring import decode_reasons, fundamentals_frame, score_batch
+from logic_ranking import top_k
+from logic_scoring import annual_report_risk
 from logic_market_regime import detect_market_regime
 
 # ======================================================
@@ -12,36 +15,50 @@ def recommend_stocks_for_goal(
     investment_amount,
     risk_profile,
     duration_months,
-    expected_return_pref
+    expected_return_pref,
+    max_workers=8,
+    symbol_timeout=10.0,
+    fetch_deadline=30.0,
+    fetch_errors=None
 ):
     """
     Returns a ranked list of stocks suitable for a specific investment goal
-    """
 
-    recommendations = []
+    Fundamentals for the whole universe are fetched concurrently
+    (max_workers at a time, symbol_timeout per symbol, fetch_deadline
+    for the batch). Pass a dict as fetch_errors to receive the
+    per-symbol error report from the fetch stage; symbols whose
+    fundamentals could not be loaded appear there as "exception"
+    errors and are left out of the ranking.
+    """
 
     # -----------------------------
     # Build required data maps
     # -----------------------------
-    from logic_fundamentals import fetch_fundamentals
+    from logic_fundamentals import fetch_fundamentals_cached
+
+    # Raw records: fallbacks are applied once, over the whole frame
+    fundamentals_map, errors = fetch_concurrently(
+        df["Symbol"].tolist(),
+        lambda s: fetch_fundamentals_cached(s, fallbacks=False),
+        max_workers=max_workers,
+        timeout=symbol_timeout,
+        deadline=fetch_deadline
+    )
+
+    if fetch_errors is not None:
+        fetch_errors.update(errors)
 
-    fundamentals_map = {}
     news_map = {}
     annual_text_map = {}
     quarterly_text_map = {}
 
-    for _, row in df.iterrows():
-        symbol = row["Symbol"]
-
-        try:
-            fundamentals_map[symbol] = fetch_fundamentals(symbol)
-        except:
-            fundamentals_map[symbol] = None
-
+    for symbol in df["Symbol"]:
         # Safe defaults (can enhance later)
         news_map[symbol] = None
         annual_text_map[symbol] = ""
         quarterly_text_map[symbol] = ""
+
     # -------------------------------
     # Determine investment style
     # -------------------------------
@@ -65,26 +82,86 @@ def recommend_stocks_for_goal(
         max_stocks = 7
 
     # -------------------------------
-    # Analyze each stock
+    # Score the whole universe in one pass
+    # -------------------------------
+    rows = [r for r in df.to_dict("records") if fundamentals_map.get(r["Symbol"])]
+    symbols = [r["Symbol"] for r in rows]
+
+    frame = fundamentals_frame(
+        (fundamentals_map[s] for s in symbols), symbols
+    ).with_fallbacks()
+
+    scores, recs, masks = score_batch(
+        frame,
+        risk_profile,
+        news_bias=[(news_map.get(s) or {}).get("overall") for s in symbols],
+        annual_risk=[annual_report_risk(annual_text_map.get(s, "")) for s in symbols]
+    )
+
+    # -------------------------------
+    # Rank & allocate (streaming top-k)
     # -------------------------------
-    for _, row in df.iterrows():
+    top = top_k(
+        _goal_candidates(
+            rows, scores, recs, masks,
+            frame, news_map, style, risk_profile
+        ),
+        max_stocks,
+        key=lambda c: c[0]
+    )
+
+    recommendations = [
+        {
+            "stock": row["Symbol"],
+            "company": row["Company"],
+            "sector": row["Sector"],
+            "goal_score": goal_score,
+            "base_score": score,
+            "recommendation": rec,
+            "reasons": decode_reasons(mask)[:3]  # keep concise
+        }
+        for goal_score, row, score, rec, mask in top
+    ]
+
+    if not recommendations:
+        return []
+
+    allocation_pct = round(100 / len(recommendations), 1)
+
+    for r in recommendations:
+        r["allocation_pct"] = allocation_pct
+        r["allocation_amount"] = round(
+            investment_amount * allocation_pct / 100
+        )
+
+    return recommendations
+
+
+# ======================================================
+# GOAL SUITABILITY (STREAMED PER STOCK)
+# ======================================================
+
+def _goal_candidates(
+    rows,
+    scores,
+    recs,
+    masks,
+    frame,
+    news_map,
+    style,
+    risk_profile
+):
+    """
+    Yields (goal_score, row, base_score, rec, reason_mask) for every
+    stock that clears the goal threshold, in universe order.
+    """
+
+    for i, (row, score, rec, mask) in enumerate(zip(rows, scores, recs, masks)):
         symbol = row["Symbol"]
 
-        fund = fundamentals_map.get(symbol)
+        fund = frame.record(i)
         news = news_map.get(symbol)
-        annual_text = annual_text_map.get(symbol, "")
-        quarterly_text = quarterly_text_map.get(symbol, "")
-
-        if not fund:
-            continue
-
-        score, rec, reasons = score_stock(
-            fund=fund,
-            news_summary=news,
-            annual_text=annual_text,
-            quarterly_text=quarterly_text,
-            risk_profile=risk_profile
-        )
+        score = int(score)
 
         # -------------------------------
         # Goal suitability adjustments
@@ -121,34 +198,4 @@ def recommend_stocks_for_goal(
         goal_score = max(0, min(100, goal_score))
 
         if goal_score >= 65:
-            recommendations.append({
-                "stock": symbol,
-                "company": row["Company"],
-                "sector": row["Sector"],
-                "goal_score": goal_score,
-                "base_score": score,
-                "recommendation": rec,
-                "reasons": reasons[:3]  # keep concise
-            })
-
-    # -------------------------------
-    # Rank & allocate
-    # -------------------------------
-    recommendations = sorted(
-        recommendations,
-        key=lambda x: x["goal_score"],
-        reverse=True
-    )[:max_stocks]
-
-    if not recommendations:
-        return []
-
-    allocation_pct = round(100 / len(recommendations), 1)
-
-    for r in recommendations:
-        r["allocation_pct"] = allocation_pct
-        r["allocation_amount"] = round(
-            investment_amount * allocation_pct / 100
-        )
-
-    return recommendations
+            yield goal_score, row, score, rec, mask
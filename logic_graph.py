@@ -0,0 +1,122 @@
+import time
+
+# ======================================================
+# DEPENDENCY-TRACKED COMPUTATION GRAPH (RERUN MEMOIZATION)
+# ======================================================
+# Streamlit re-executes the whole script on every interaction.
+# Each expensive step is declared as a node with explicit inputs:
+#
+#   params: plain widget values (compared by equality)
+#   deps:   names of upstream nodes (compared by version)
+#
+# A node recomputes only when a param changed, an upstream node
+# was recomputed, or its ttl expired; otherwise the stored value
+# is returned. One value is kept per node name, in a dict that
+# lives in session state, so each session has its own graph.
+#
+# A node fn returns Uncached(value) for results that must not be
+# reused (a failed fetch): value is passed on as usual, but the
+# node recomputes on the next run instead of serving it until the
+# ttl runs out.
+
+
+def _freeze(value):
+    """
+    Comparable form of a param (lists / dicts / sets by content).
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+class Uncached:
+    """
+    Wraps a node result that is used once but not memoized.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _Node:
+    __slots__ = ("key", "value", "version", "computed_at")
+
+    def __init__(self, key, value, version, computed_at):
+        self.key = key
+        self.value = value
+        self.version = version
+        self.computed_at = computed_at
+
+
+class ComputationGraph:
+    """
+    graph.node(name, fn, deps=("a", "b"), ttl=None, **params)
+        → fn(value_of_a, value_of_b, **params), memoized
+          (unless fn returns Uncached(value))
+
+    Nodes are declared in script order; every dep must have been
+    evaluated earlier in the same run. graph.recomputed lists the
+    nodes that actually ran since begin_run().
+    """
+
+    def __init__(self, store=None):
+        self._store = {} if store is None else store
+        self._store.setdefault("nodes", {})
+        self._store.setdefault("version", 0)
+        self.recomputed = []
+
+    def begin_run(self):
+        self.recomputed = []
+        return self
+
+    def _dep_versions(self, deps):
+        nodes = self._store["nodes"]
+        missing = [d for d in deps if d not in nodes]
+        if missing:
+            raise KeyError(f"Nodes not evaluated yet: {', '.join(missing)}")
+        return tuple((d, nodes[d].version) for d in deps)
+
+    def node(self, name, fn, deps=(), ttl=None, **params):
+        key = (self._dep_versions(deps), _freeze(params))
+        nodes = self._store["nodes"]
+        current = nodes.get(name)
+        now = time.time()
+
+        if (
+            current is not None
+            and current.key == key
+            and (ttl is None or now - current.computed_at < ttl)
+        ):
+            return current.value
+
+        value = fn(*(nodes[d].value for d in deps), **params)
+
+        # A None key never matches, so the next run recomputes
+        if isinstance(value, Uncached):
+            value, key = value.value, None
+
+        self._store["version"] += 1
+        nodes[name] = _Node(key, value, self._store["version"], now)
+        self.recomputed.append(name)
+        return value
+
+    def value(self, name, default=None):
+        current = self._store["nodes"].get(name)
+        return default if current is None else current.value
+
+    def invalidate(self, name=None):
+        """
+        Forgets one node (or all), forcing it to recompute.
+        """
+
+        if name is None:
+            self._store["nodes"].clear()
+        else:
+            self._store["nodes"].pop(name, None)
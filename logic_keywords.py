@@ -0,0 +1,141 @@
+import re
+
+# ======================================================
+# MULTI-KEYWORD MATCHER
+# ======================================================
+# Built once at import. Matches must start on a word boundary
+# ("loss" hits "losses" but not "glossary"), and overlapping
+# keywords ("material risk" and "risk") are all reported.
+#
+# Two scans, picked by keyword count:
+#   - up to SCAN_LIMIT keywords: one str.find pass per keyword.
+#     CPython's substring search skips ahead in C, so a few dozen
+#     of these beat any single regex pass, which pays for every
+#     text position in the regex engine.
+#   - larger sets: one regex, the keywords factored into a trie, so
+#     each text position costs at most one keyword length and the
+#     time no longer grows with the number of keywords.
+#
+# benchmarks/bench_keywords.py measures both against plain
+# "kw in text" scans.
+
+SCAN_LIMIT = 40
+
+
+def _word_start(text, start):
+    return not start or not (text[start - 1].isalnum() or text[start - 1] == "_")
+
+
+def _trie_pattern(words):
+    """
+    Regex for a set of words, factored by common prefixes.
+    Longer continuations are tried first.
+    """
+
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        ends = "" in node
+        branches = [
+            re.escape(ch) + build(child)
+            for ch, child in sorted(node.items()) if ch
+        ]
+
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends:
+            return branches[0]
+
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if ends else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    Finds every keyword hit in a text in a single pass.
+
+    matcher.finditer(text) → (keyword, position) pairs, in text order
+    matcher.hits(text)     → {keyword: [positions]}
+    matcher.found(text)    → set of keywords present
+
+    Matching is case-insensitive (text is lowercased first).
+    """
+
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in keywords))
+        self.scan = len(self.keywords) <= SCAN_LIMIT
+
+        # No leading \b: a pattern that starts with its first-character
+        # set lets the regex engine skip ahead; boundaries are checked
+        # on the (rare) candidates instead.
+        self._regex = re.compile(_trie_pattern(self.keywords))
+
+        # Longest hit at a position → every keyword that is a prefix of it
+        self._prefixes = {
+            k: [p for p in self.keywords if k.startswith(p)]
+            for k in self.keywords
+        }
+
+    def _find_all(self, text, keyword):
+        find = text.find
+        start = find(keyword)
+        while start != -1:
+            if _word_start(text, start):
+                yield start
+            start = find(keyword, start + 1)
+
+    def finditer(self, text):
+        if not text:
+            return
+
+        text = text.lower()
+
+        if self.scan:
+            hits = sorted(
+                (start, i)
+                for i, keyword in enumerate(self.keywords)
+                for start in self._find_all(text, keyword)
+            )
+            for start, i in hits:
+                yield self.keywords[i], start
+            return
+
+        search = self._regex.search
+        pos = 0
+
+        while True:
+            m = search(text, pos)
+            if m is None:
+                return
+
+            start = m.start()
+            pos = start + 1
+
+            if not _word_start(text, start):
+                continue
+
+            for keyword in self._prefixes[m.group()]:
+                yield keyword, start
+
+    def hits(self, text):
+        result = {}
+        for keyword, pos in self.finditer(text):
+            result.setdefault(keyword, []).append(pos)
+        return result
+
+    def found(self, text):
+        if self.scan and text:
+            # Only the first hit of each keyword is needed
+            text = text.lower()
+            return {
+                keyword for keyword in self.keywords
+                if next(self._find_all(text, keyword), None) is not None
+            }
+        return {keyword for keyword, _ in self.finditer(text)}
@@ -1,10 +1,135 @@
+import os
+import threading
+import time
+
+from logic_batch_fetch import fetch_concurrently
+from logic_disk_cache import CACHE_DIR
+from logic_keywords import KeywordMatcher
+from logic_news_store import HeadlineStore
+from logic_providers import get_provider
+from logic_singleflight import coalesce
+
+# ======================================================
+# NEWS FETCH (PROVIDER-BACKED, TTL-CACHED)
+# ======================================================
+
+NEWS_TTL = 1800
+
+_news_cache = {}
+_news_lock = threading.Lock()
+
+
+def fetch_news_entries(company):
+    """
+    Fetches the latest 5 news items for a company via the provider.
+    Concurrent calls for the same company share one request.
+    """
+
+    return coalesce("news", company, lambda: get_provider().news(company, 5))
+
+
+def _cache_news(company, entries):
+    with _news_lock:
+        _news_cache[company] = (time.monotonic(), entries)
+
+    # Sentiment history is best-effort: a disk error never hides news
+    try:
+        get_news_store().ingest(company, entries)
+    except OSError:
+        pass
+
+
+def refresh_news(company):
+    """
+    Fetches news for a company and replaces its cached entry.
+    New headlines are appended to the headline store.
+    Raises on fetch errors, leaving the previous entry in place.
+    """
+
+    entries = list(fetch_news_entries(company))
+    _cache_news(company, entries)
+
+    return entries
+
+
+def refresh_news_many(companies, max_workers=8, timeout=10.0, deadline=30.0):
+    """
+    Fetches news for many companies concurrently and caches it.
+
+    Feeds share one keep-alive pool and are re-requested with
+    conditional GET, so unchanged feeds cost a 304.
+
+    Returns (results, errors) as fetch_concurrently does.
+    """
+
+    results, errors = fetch_concurrently(
+        companies,
+        lambda c: list(fetch_news_entries(c)),
+        max_workers=max_workers,
+        timeout=timeout,
+        deadline=deadline
+    )
+
+    for company, entries in results.items():
+        _cache_news(company, entries)
+
+    return results, errors
+
+
+def get_news(company):
+    """
+    Returns cached news for a company, fetching only on miss / expiry.
+    When the fetch fails, the last headlines (even expired) are kept.
+    """
+
+    with _news_lock:
+        entry = _news_cache.get(company)
+
+    if entry and time.monotonic() - entry[0] < NEWS_TTL:
+        return list(entry[1])
+
+    try:
+        return refresh_news(company)
+    except Exception:
+        return list(entry[1]) if entry else []
+
+
 # ======================================================
 # NEWS SENTIMENT ANALYSIS (RULE-BASED, SAFE)
 # ======================================================
 
+POSITIVE_NEWS_KEYWORDS = frozenset([
+    "growth", "profit", "beat", "record", "expansion",
+    "strong", "upgrade", "order win", "recovery", "margin improvement"
+])
+
+NEGATIVE_NEWS_KEYWORDS = frozenset([
+    "loss", "decline", "fall", "warning", "downgrade",
+    "risk", "fraud", "probe", "litigation", "default",
+    "margin pressure", "slowdown"
+])
+
+NEWS_MATCHER = KeywordMatcher(POSITIVE_NEWS_KEYWORDS | NEGATIVE_NEWS_KEYWORDS)
+
+
+def classify_headline(title):
+    """
+    Returns "positive", "negative" or "neutral" for one headline.
+    """
+
+    found = NEWS_MATCHER.found(title)
+
+    if found & POSITIVE_NEWS_KEYWORDS:
+        return "positive"
+    if found & NEGATIVE_NEWS_KEYWORDS:
+        return "negative"
+    return "neutral"
+
+
 def analyze_news(entries):
     """
     Analyzes recent news headlines and classifies sentiment.
+    Headlines already in the headline store reuse their stored label.
     Input:
         entries → list of RSS feed entries (Google News)
     Output:
@@ -26,29 +151,19 @@ def analyze_news(entries):
     if not entries:
         return summary
 
-    positive_keywords = [
-        "growth", "profit", "beat", "record", "expansion",
-        "strong", "upgrade", "order win", "recovery", "margin improvement"
-    ]
-
-    negative_keywords = [
-        "loss", "decline", "fall", "warning", "downgrade",
-        "risk", "fraud", "probe", "litigation", "default",
-        "margin pressure", "slowdown"
-    ]
+    store = get_news_store()
 
     for e in entries:
-        try:
-            title = (e.title or "").lower()
-        except Exception:
-            title = ""
-
-        if any(word in title for word in positive_keywords):
-            summary["positive"] += 1
-        elif any(word in title for word in negative_keywords):
-            summary["negative"] += 1
-        else:
-            summary["neutral"] += 1
+        label = store.label(e)
+
+        if label is None:
+            try:
+                title = e.title or ""
+            except Exception:
+                title = ""
+            label = classify_headline(title)
+
+        summary[label] += 1
 
     # --------------------------------------------------
     # OVERALL BIAS LOGIC
@@ -61,3 +176,32 @@ def analyze_news(entries):
         summary["overall"] = "Neutral"
 
     return summary
+
+
+# ======================================================
+# HEADLINE HISTORY (PERSISTENT, ROLLING WINDOWS)
+# ======================================================
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_news_store():
+    """
+    Returns the process-wide headline store (CACHE_DIR/headlines.jsonl).
+    """
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = HeadlineStore(
+                os.path.join(CACHE_DIR, "headlines.jsonl"), classify_headline
+            )
+        return _store
+
+
+def news_history(company):
+    """
+    Rolling 1 / 7 / 30 day headline sentiment counts for a company.
+    """
+    return get_news_store().counts(company)
@@ -0,0 +1,161 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# ======================================================
+# APPEND-ONLY HEADLINE STORE (DEDUP + ROLLING SENTIMENT)
+# ======================================================
+
+DAY = 86400
+
+# window name -> length in seconds
+WINDOWS = {"1d": DAY, "7d": 7 * DAY, "30d": 30 * DAY}
+
+LABELS = ("positive", "neutral", "negative")
+
+
+def headline_id(item):
+    """
+    Stable identity of a news item: feed id, else its link.
+    """
+    return getattr(item, "id", None) or getattr(item, "link", None) or ""
+
+
+class _Window:
+    """
+    Label counts over the last `span` seconds.
+    add() is O(1); expired items are dropped lazily (amortized O(1)).
+    """
+
+    def __init__(self, span):
+        self.span = span
+        self.items = deque()
+        self.counts = dict.fromkeys(LABELS, 0)
+
+    def add(self, ts, label):
+        self.items.append((ts, label))
+        self.counts[label] += 1
+
+    def expire(self, now):
+        items, counts = self.items, self.counts
+        while items and items[0][0] <= now - self.span:
+            counts[items.popleft()[1]] -= 1
+
+
+class HeadlineStore:
+    """
+    Persists every headline seen per key (company) as one JSON line:
+    {key, id, title, link, published, seen_at, label}
+
+    - Items are deduplicated by (key, id / link); only unseen ones
+      are classified and appended.
+    - Rolling positive / neutral / negative counts are kept per key
+      for every window in WINDOWS, timed by when an item was first
+      seen (seen_at), and rebuilt from the file on start-up.
+    """
+
+    def __init__(self, path, classify, windows=None):
+        self.path = path
+        self.classify = classify
+        self.windows = dict(windows or WINDOWS)
+        self._seen = set()
+        self._labels = {}
+        self._rolling = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _window(self, key):
+        if key not in self._rolling:
+            self._rolling[key] = {
+                name: _Window(span) for name, span in self.windows.items()
+            }
+        return self._rolling[key]
+
+    def _remember(self, record):
+        self._seen.add((record["key"], record["id"]))
+        self._labels[record["id"]] = record["label"]
+
+        for window in self._window(record["key"]).values():
+            window.add(record["seen_at"], record["label"])
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                lines = fh.readlines()
+        except FileNotFoundError:
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn write from a crashed process
+            if (record["key"], record["id"]) not in self._seen:
+                self._remember(record)
+
+    def label(self, item):
+        """
+        Known label for an item, or None if it was never stored.
+        """
+        with self._lock:
+            return self._labels.get(headline_id(item))
+
+    def ingest(self, key, items, now=None):
+        """
+        Stores unseen items for key and returns the label of every
+        item, in order. Only new items are classified.
+        """
+
+        now = time.time() if now is None else now
+        labels = []
+        new = []
+
+        with self._lock:
+            for item in items:
+                uid = headline_id(item)
+
+                if (key, uid) in self._seen:
+                    labels.append(self._labels[uid])
+                    continue
+
+                label = self._labels.get(uid) or self.classify(item.title or "")
+                record = {
+                    "key": key,
+                    "id": uid,
+                    "title": item.title,
+                    "link": getattr(item, "link", ""),
+                    "published": getattr(item, "published", ""),
+                    "seen_at": now,
+                    "label": label,
+                }
+                self._remember(record)
+                new.append(record)
+                labels.append(label)
+
+            if new:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as fh:
+                    fh.write("".join(json.dumps(r) + "\n" for r in new))
+
+        return labels
+
+    def counts(self, key, now=None):
+        """
+        Returns {window: {positive, neutral, negative}} for key.
+        """
+
+        now = time.time() if now is None else now
+
+        with self._lock:
+            rolling = self._window(key)
+            result = {}
+            for name, window in rolling.items():
+                window.expire(now)
+                result[name] = dict(window.counts)
+            return result
+
+    def stats(self):
+        with self._lock:
+            return {"headlines": len(self._seen), "keys": len(self._rolling)}
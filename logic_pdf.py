@@ -0,0 +1,186 @@
+import io
+import multiprocessing
+import os
+import tempfile
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from pypdf import PdfReader
+
+# ======================================================
+# PARALLEL PDF TEXT EXTRACTION (PAGE-LEVEL WORKER POOL)
+# ======================================================
+# Pages are split into chunks and extracted on one long-lived
+# process pool. The document is written to a temporary file once;
+# tasks carry only (path, start, stop), and each worker keeps the
+# last few parsed documents, so a document is parsed once per
+# worker, not per chunk. At most max_in_flight chunks are pending
+# or buffered at any time, which caps peak memory.
+#
+# Workers are started with forkserver (spawn where unavailable):
+# the app process runs many threads, and forking it can deadlock.
+
+CHUNK_PAGES = 16
+
+_WORKER_READERS = 2
+
+_worker_readers = OrderedDict()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def read_pdf_bytes(source):
+    """
+    Raw PDF bytes from bytes, a path or a file-like object
+    (e.g. a Streamlit UploadedFile).
+    """
+
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fh:
+            return fh.read()
+
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+
+    position = source.tell()
+    source.seek(0)
+    data = source.read()
+    source.seek(position)
+    return data
+
+
+def _extract_pages(reader, start, stop):
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _extract_chunk(path, start, stop):
+    reader = _worker_readers.get(path)
+    if reader is None:
+        with open(path, "rb") as fh:
+            reader = PdfReader(io.BytesIO(fh.read()))
+        _worker_readers[path] = reader
+        while len(_worker_readers) > _WORKER_READERS:
+            _worker_readers.popitem(last=False)
+    return _extract_pages(reader, start, stop)
+
+
+def _mp_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def get_pool():
+    """
+    Process-wide extraction pool (os.cpu_count() workers), started
+    on first use and reused for every document.
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=_mp_context()
+            )
+        return _pool
+
+
+def _discard_pool(pool):
+    global _pool
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_pages(
+    source,
+    max_pages=None,
+    workers=None,
+    chunk_pages=CHUNK_PAGES,
+    max_in_flight=None,
+    progress=None
+):
+    """
+    Yields (page_number, text) for every page, in page order.
+
+    Inputs:
+        source: bytes, path or file-like PDF
+        max_pages: stop after this many pages (None = whole document)
+        workers: chunks extracted in parallel (default: CPU count);
+                 1 = in-process
+        chunk_pages: pages per task
+        max_in_flight: chunks submitted but not yet yielded
+                       (default: 2 × workers)
+        progress: optional callback(done_pages, total_pages)
+
+    Short documents (one chunk or less) are extracted in-process,
+    where starting a pool would cost more than it saves.
+    """
+
+    data = read_pdf_bytes(source)
+    reader = PdfReader(io.BytesIO(data))
+
+    total = len(reader.pages)
+    if max_pages is not None:
+        total = min(total, max_pages)
+
+    workers = workers or os.cpu_count() or 1
+    ranges = [
+        (start, min(start + chunk_pages, total))
+        for start in range(0, total, chunk_pages)
+    ]
+
+    if workers == 1 or len(ranges) <= 1:
+        for start, stop in ranges:
+            for i, text in enumerate(_extract_pages(reader, start, stop), start):
+                yield i + 1, text
+            if progress:
+                progress(stop, total)
+        return
+
+    del reader
+    max_in_flight = max_in_flight or 2 * workers
+
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+
+    pool = get_pool()
+    pending = deque()
+    queued = iter(ranges)
+
+    def submit_next():
+        task = next(queued, None)
+        if task is not None:
+            pending.append((task, pool.submit(_extract_chunk, path, *task)))
+
+    try:
+        for _ in range(max_in_flight):
+            submit_next()
+
+        while pending:
+            (start, stop), future = pending.popleft()
+            texts = future.result()
+            submit_next()
+
+            for i, text in enumerate(texts, start):
+                yield i + 1, text
+            if progress:
+                progress(stop, total)
+    except BrokenProcessPool:
+        # A worker died: the next document gets a fresh pool
+        _discard_pool(pool)
+        raise
+    finally:
+        for _, future in pending:
+            future.cancel()
+        os.remove(path)
+
@@ -0,0 +1,316 @@
+import json
+import os
+import random
+import threading
+import time
+import urllib.parse
+from collections import namedtuple
+
+import pandas as pd
+import yfinance as yf
+
+from logic_feeds import FEEDS
+from logic_symbols import yahoo_ticker
+
+# ======================================================
+# MARKET DATA PROVIDERS (LIVE / RECORD / REPLAY)
+# ======================================================
+
+NewsItem = namedtuple("NewsItem", ["title", "link", "published", "id"])
+
+class MarketDataProvider:
+    """
+    Interface for every network-backed data source in the app.
+
+    quote(symbol)        → last traded price or None
+    quotes(symbols)      → {symbol: latest close or None} (one request)
+    info(symbol)         → raw info dict (may be empty)
+    history(symbol, p)   → pd.Series of closes (may be empty)
+    news(company, limit) → list[NewsItem]
+
+    Methods raise on transport errors; callers decide the fallback.
+    """
+
+    def quote(self, symbol):
+        raise NotImplementedError
+
+    def quotes(self, symbols):
+        raise NotImplementedError
+
+    def info(self, symbol):
+        raise NotImplementedError
+
+    def history(self, symbol, period="1d"):
+        raise NotImplementedError
+
+    def news(self, company, limit=5):
+        raise NotImplementedError
+
+
+# ======================================================
+# LIVE PROVIDER (YAHOO FINANCE + GOOGLE NEWS)
+# ======================================================
+
+def _last_closes(history, tickers):
+    """
+    Extracts the latest non-null close per ticker from a
+    yf.download frame (single or multi-ticker layout).
+    """
+
+    closes = {}
+
+    if history is None or history.empty:
+        return closes
+
+    if isinstance(history.columns, pd.MultiIndex):
+        available = set(history.columns.get_level_values(0))
+        for t in tickers:
+            if t not in available or "Close" not in history[t]:
+                continue
+            series = history[t]["Close"].dropna()
+            if not series.empty:
+                closes[t] = float(series.iloc[-1])
+    elif "Close" in history.columns and len(tickers) == 1:
+        series = history["Close"].dropna()
+        if not series.empty:
+            closes[tickers[0]] = float(series.iloc[-1])
+
+    return closes
+
+
+# Google News RSS search; ADVISOR_NEWS_URL may point at another
+# feed server (e.g. a local stub) using the same {query} slot.
+NEWS_URL = os.environ.get(
+    "ADVISOR_NEWS_URL",
+    "https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
+)
+
+
+class YahooProvider(MarketDataProvider):
+    """
+    Live data: yfinance for market data, Google News RSS for news.
+    News feeds go through the shared FeedClient (pooled, conditional GET).
+    """
+
+    def quote(self, symbol):
+        price = yf.Ticker(yahoo_ticker(symbol)).fast_info.get("lastPrice")
+        return float(price) if price else None
+
+    def quotes(self, symbols):
+        tickers = {s: yahoo_ticker(s) for s in symbols}
+        history = yf.download(
+            list(tickers.values()),
+            period="5d",
+            group_by="ticker",
+            auto_adjust=False,
+            threads=True,
+            progress=False
+        )
+        closes = _last_closes(history, list(tickers.values()))
+
+        return {s: closes.get(t) for s, t in tickers.items()}
+
+    def info(self, symbol):
+        return dict(yf.Ticker(yahoo_ticker(symbol)).info or {})
+
+    def history(self, symbol, period="1d"):
+        hist = yf.Ticker(yahoo_ticker(symbol)).history(period=period)
+        if hist.empty:
+            return pd.Series(dtype="float64")
+        closes = hist["Close"]
+        closes.index = closes.index.strftime("%Y-%m-%d")
+        return closes
+
+    def news(self, company, limit=5):
+        q = urllib.parse.quote(f"{company} stock India")
+        url = NEWS_URL.format(query=q)
+
+        return [
+            NewsItem(
+                title=e.get("title", ""),
+                link=e.get("link", ""),
+                published=e.get("published", ""),
+                id=e.get("id") or e.get("link", "")
+            )
+            for e in FEEDS.fetch(url)[:limit]
+        ]
+
+
+# ======================================================
+# RECORD / REPLAY (OFFLINE BENCHMARKING)
+# ======================================================
+
+def _payload_path(directory, kind, key):
+    name = urllib.parse.quote(str(key), safe="") + ".json"
+    return os.path.join(directory, kind, name)
+
+
+def _encode(kind, value):
+    if kind == "history":
+        return {str(k): float(v) for k, v in value.items()}
+    if kind == "news":
+        return [item._asdict() for item in value]
+    return value
+
+
+def _decode(kind, value):
+    if kind == "history":
+        return pd.Series(value, dtype="float64")
+    if kind == "news":
+        return [NewsItem(**item) for item in value]
+    return value
+
+
+class RecordingProvider(MarketDataProvider):
+    """
+    Wraps another provider and writes every successful payload to
+    directory/<kind>/<key>.json for later replay.
+    """
+
+    def __init__(self, inner, directory):
+        self.inner = inner
+        self.directory = directory
+
+    def _save(self, kind, key, value):
+        path = _payload_path(self.directory, kind, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(_encode(kind, value), fh, default=str)
+        os.replace(tmp, path)
+        return value
+
+    def quote(self, symbol):
+        return self._save("quote", symbol, self.inner.quote(symbol))
+
+    def quotes(self, symbols):
+        prices = self.inner.quotes(symbols)
+        for s, p in prices.items():
+            self._save("quotes", s, p)
+        return prices
+
+    def info(self, symbol):
+        return self._save("info", symbol, self.inner.info(symbol))
+
+    def history(self, symbol, period="1d"):
+        return self._save(
+            "history", f"{symbol}|{period}", self.inner.history(symbol, period)
+        )
+
+    def news(self, company, limit=5):
+        return self._save(
+            "news", f"{company}|{limit}", self.inner.news(company, limit)
+        )
+
+
+class ReplayProvider(MarketDataProvider):
+    """
+    Serves payloads captured by RecordingProvider, fully offline.
+
+    latency: seconds added per call (a dict may give one per kind)
+    jitter: ± uniform seconds added on top, from a seeded RNG so
+            runs are reproducible
+    Missing recordings raise KeyError, like a failed request.
+    """
+
+    def __init__(self, directory, latency=0.0, jitter=0.0, seed=0):
+        self.directory = directory
+        self.latency = latency
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _delay(self, kind):
+        base = (
+            self.latency.get(kind, 0.0)
+            if isinstance(self.latency, dict) else self.latency
+        )
+        with self._lock:
+            extra = self._rng.uniform(-self.jitter, self.jitter)
+        delay = max(0.0, base + extra)
+        if delay:
+            time.sleep(delay)
+
+    def _load(self, kind, key):
+        path = _payload_path(self.directory, kind, key)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                return _decode(kind, json.load(fh))
+        except FileNotFoundError:
+            raise KeyError(f"No recording for {kind}:{key}") from None
+
+    def quote(self, symbol):
+        self._delay("quote")
+        return self._load("quote", symbol)
+
+    def quotes(self, symbols):
+        self._delay("quotes")
+        prices = {}
+        for s in symbols:
+            try:
+                prices[s] = self._load("quotes", s)
+            except KeyError:
+                prices[s] = None
+        return prices
+
+    def info(self, symbol):
+        self._delay("info")
+        return self._load("info", symbol)
+
+    def history(self, symbol, period="1d"):
+        self._delay("history")
+        return self._load("history", f"{symbol}|{period}")
+
+    def news(self, company, limit=5):
+        self._delay("news")
+        return self._load("news", f"{company}|{limit}")
+
+
+# ======================================================
+# ACTIVE PROVIDER SELECTION
+# ======================================================
+# ADVISOR_PROVIDER      live | record | replay   (default: live)
+# ADVISOR_PROVIDER_DIR  recordings directory
+# ADVISOR_REPLAY_LATENCY_MS  synthetic latency per replayed call
+
+RECORDINGS_DIR = os.environ.get(
+    "ADVISOR_PROVIDER_DIR", os.path.join(".cache", "recordings")
+)
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def _provider_from_env():
+    mode = os.environ.get("ADVISOR_PROVIDER", "live").lower()
+
+    if mode == "record":
+        return RecordingProvider(YahooProvider(), RECORDINGS_DIR)
+    if mode == "replay":
+        latency_ms = float(os.environ.get("ADVISOR_REPLAY_LATENCY_MS", "0"))
+        return ReplayProvider(RECORDINGS_DIR, latency=latency_ms / 1000)
+    if mode != "live":
+        raise ValueError(f"Unknown ADVISOR_PROVIDER: {mode}")
+    return YahooProvider()
+
+
+def get_provider():
+    """
+    Returns the process-wide provider (configured from env on first use).
+    """
+    global _provider
+
+    with _provider_lock:
+        if _provider is None:
+            _provider = _provider_from_env()
+        return _provider
+
+
+def set_provider(provider):
+    """
+    Swaps the process-wide provider (e.g. for offline benchmarks).
+    """
+    global _provider
+
+    with _provider_lock:
+        _provider = provider
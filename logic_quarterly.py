@@ -1,7 +1,45 @@
+from logic_keywords import KeywordMatcher
+
 # ======================================================
 # QUARTERLY INTELLIGENCE ENGINE
 # ======================================================
 
+POSITIVE_KEYWORDS = [
+    "growth",
+    "margin expansion",
+    "record revenue",
+    "strong demand",
+    "order book",
+    "profitability improvement",
+    "cost control",
+    "capacity expansion"
+]
+
+NEGATIVE_KEYWORDS = [
+    "margin pressure",
+    "slowdown",
+    "weak demand",
+    "loss",
+    "cost inflation",
+    "pricing pressure",
+    "decline",
+    "uncertainty"
+]
+
+RISK_KEYWORDS = [
+    "risk",
+    "headwind",
+    "litigation",
+    "regulatory",
+    "geopolitical",
+    "currency volatility"
+]
+
+QUARTERLY_MATCHER = KeywordMatcher(
+    POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS + RISK_KEYWORDS
+)
+
+
 def analyze_quarterly_text(text):
     """
     Analyzes quarterly report text for directional signals.
@@ -20,65 +58,62 @@ def analyze_quarterly_text(text):
     if not text or not isinstance(text, str):
         return 0, []
 
+    # One pass over the text for every keyword
+    found = dict.fromkeys(QUARTERLY_MATCHER.found(text))
+
+    return _score_signals(found)
+
+
+def analyze_quarterly_report(index):
+    """
+    Same analysis over a ReportIndex (logic_report_index).
+    Each keyword is an index lookup, and every signal cites the
+    first page it appears on, e.g. "... : order book (p. 4)".
+    """
+
+    found = {}
+    for kw in POSITIVE_KEYWORDS + NEGATIVE_KEYWORDS + RISK_KEYWORDS:
+        hit = index.first(kw)
+        if hit is not None:
+            found[kw] = index.page_of(hit)
+
+    return _score_signals(found)
+
+
+def _score_signals(found):
+    """
+    found: {keyword: first page or None}
+    """
+
     score = 0
     signals = []
 
-    t = text.lower()
+    def cite(kw):
+        return f" (p. {found[kw]})" if found[kw] else ""
 
     # -------------------------------
     # Positive signals
     # -------------------------------
-    positive_keywords = [
-        "growth",
-        "margin expansion",
-        "record revenue",
-        "strong demand",
-        "order book",
-        "profitability improvement",
-        "cost control",
-        "capacity expansion"
-    ]
-
-    for kw in positive_keywords:
-        if kw in t:
+    for kw in POSITIVE_KEYWORDS:
+        if kw in found:
             score += 2
-            signals.append(f"Positive quarterly signal: {kw}")
+            signals.append(f"Positive quarterly signal: {kw}{cite(kw)}")
 
     # -------------------------------
     # Negative signals
     # -------------------------------
-    negative_keywords = [
-        "margin pressure",
-        "slowdown",
-        "weak demand",
-        "loss",
-        "cost inflation",
-        "pricing pressure",
-        "decline",
-        "uncertainty"
-    ]
-
-    for kw in negative_keywords:
-        if kw in t:
+    for kw in NEGATIVE_KEYWORDS:
+        if kw in found:
             score -= 2
-            signals.append(f"Negative quarterly signal: {kw}")
+            signals.append(f"Negative quarterly signal: {kw}{cite(kw)}")
 
     # -------------------------------
     # Risk disclosures (extra penalty)
     # -------------------------------
-    risk_keywords = [
-        "risk",
-        "headwind",
-        "litigation",
-        "regulatory",
-        "geopolitical",
-        "currency volatility"
-    ]
-
-    for kw in risk_keywords:
-        if kw in t:
+    for kw in RISK_KEYWORDS:
+        if kw in found:
             score -= 1
-            signals.append(f"Risk disclosure noted: {kw}")
+            signals.append(f"Risk disclosure noted: {kw}{cite(kw)}")
 
     # -------------------------------
     # Clamp score to safe range
@@ -0,0 +1,317 @@
+import re
+from collections import namedtuple
+from datetime import date
+
+# ======================================================
+# QUARTERLY RESULTS TABLE EXTRACTION (TYPED FIGURES)
+# ======================================================
+# Indian results statements list one line item per row with the
+# quarter columns first: current quarter, preceding quarter,
+# corresponding quarter last year (then year-to-date / full year).
+# Each row is matched by label, its first three numbers become
+# the current / previous / year_ago figures.
+
+# field -> row label pattern (text is lowercased)
+ROW_LABELS = {
+    "revenue": r"(?:total )?revenue from operations|net sales|income from operations",
+    "other_income": r"other income",
+    "total_income": r"total income",
+    "total_expenses": r"total expenses",
+    "finance_costs": r"finance costs?",
+    "depreciation": r"depreciation(?: and | ?& ?)amorti[sz]ation(?: expenses?)?",
+    "ebitda": r"ebitda",
+    "pbt": r"profit\s*(?:/\s*\(loss\)\s*)?before (?:exceptional items and )?tax",
+    "tax": r"(?:total )?tax expenses?",
+    "pat": r"(?:net )?profit\s*(?:/\s*\(loss\)\s*)?(?:for the (?:period|quarter)|after tax)",
+}
+
+FIELDS = tuple(ROW_LABELS)
+
+# Optional serial ("1", "iv", "(a)", "2.") before the label
+_SERIAL = r"^\s*(?:\(?[0-9ivx]{1,4}[.)]?\s+|\([a-z]\)\s*)?"
+
+_ROWS = [
+    (field, re.compile(_SERIAL + "(?:" + label + r")\b[^0-9(\-]*(.*)$", re.M))
+    for field, label in ROW_LABELS.items()
+]
+
+# A figure, or a lone dash meaning nil
+_NUMBER = re.compile(r"\(?-?\d[\d,]*(?:\.\d+)?\)?|(?<!\S)[-–—](?!\S)")
+
+# Parenthesised notes such as "(refer note 5)" and row formulas
+# such as "(1+2)" or "(5-6)", which would otherwise read as figures
+_NOTE = re.compile(r"\([^)]*[a-z][^)]*\)|\(\s*\d+(?:\s*[-+]\s*\d+)+\s*\)")
+
+PERIODS = ("current", "previous", "year_ago")
+
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun",
+         "jul", "aug", "sep", "oct", "nov", "dec"], 1
+    )
+}
+_MONTH = r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+
+# "quarter ended 30 june 2024", "... june 30, 2024", "... 30.06.2024"
+_PERIOD_END = re.compile(
+    r"(?:quarter|three months|period) ended\s*(?:on\s*)?"
+    r"(?:(\d{1,2})(?:st|nd|rd|th)?[\s-]+" + _MONTH + r"[\s,-]+(\d{4})"
+    r"|" + _MONTH + r"\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})"
+    r"|(\d{1,2})[./-](\d{1,2})[./-](\d{4}))"
+)
+
+
+def _parse_number(token):
+    if token in ("-", "–", "—"):
+        return 0.0
+    negative = token.startswith("(") and token.endswith(")") or token.startswith("-")
+    value = float(token.strip("()-").replace(",", ""))
+    return -value if negative else value
+
+
+def _row_figures(rest):
+    numbers = [_parse_number(t) for t in _NUMBER.findall(_NOTE.sub(" ", rest))]
+    return numbers[:3] if len(numbers) >= 3 else None
+
+
+class QuarterlyResults(
+    namedtuple(
+        "QuarterlyResults",
+        ["page", "period_end", "current", "previous", "year_ago",
+         "growth", "checks"]
+    )
+):
+    """
+    Typed figures from one results statement.
+
+    page: page the statement was read from
+    period_end: date the reported quarter ended, or None if not found
+    current / previous / year_ago: {field: float or None}
+    growth: {revenue_yoy, revenue_qoq, pat_yoy, pat_qoq,
+             ebitda_margin, net_margin} (floats or None)
+    checks: {identity name: bool} for the identities that could
+            be tested; .valid requires at least one, all passing
+    """
+
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        return bool(self.checks) and all(self.checks.values())
+
+
+# ======================================================
+# EXTRACTION
+# ======================================================
+
+def _page_rows(text):
+    rows = {}
+    for field, pattern in _ROWS:
+        for m in pattern.finditer(text):
+            figures = _row_figures(m.group(1))
+            if figures:
+                rows[field] = figures
+                break
+    return rows
+
+
+def _period_end(text):
+    """
+    End date of the quarter a statement reports, or None.
+    """
+
+    m = _PERIOD_END.search(text)
+    if m is None:
+        return None
+
+    g = m.groups()
+    if g[0]:
+        day, month, year = int(g[0]), _MONTHS[g[1]], int(g[2])
+    elif g[3]:
+        day, month, year = int(g[4]), _MONTHS[g[3]], int(g[5])
+    else:
+        day, month, year = int(g[6]), int(g[7]), int(g[8])
+
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _change(new, old):
+    # Relative to the size of the base, so a narrowing loss or a
+    # loss turning into profit reads as growth
+    if new is None or old in (None, 0):
+        return None
+    return round((new - old) / abs(old), 4)
+
+
+def _ratio(part, whole):
+    if part is None or whole in (None, 0):
+        return None
+    return round(part / whole, 4)
+
+
+def _close(a, b):
+    return abs(a - b) <= max(1.0, 0.01 * max(abs(a), abs(b)))
+
+
+def _identities(p):
+    """
+    Accounting identities for one period; only testable ones.
+    """
+
+    checks = {}
+
+    if None not in (p["total_income"], p["revenue"], p["other_income"]):
+        checks["total_income = revenue + other_income"] = _close(
+            p["total_income"], p["revenue"] + p["other_income"]
+        )
+
+    if None not in (p["pbt"], p["tax"], p["pat"]):
+        checks["pat = pbt - tax"] = _close(p["pat"], p["pbt"] - p["tax"])
+
+    if None not in (p["ebitda"], p["pbt"], p["finance_costs"], p["depreciation"]):
+        checks["ebitda >= pbt"] = p["ebitda"] >= p["pbt"] - 1.0
+
+    return checks
+
+
+def extract_quarterly_results(pages):
+    """
+    Reads the results statement from a report's pages.
+
+    Inputs:
+        pages: iterable of (page_number, text)
+
+    Returns:
+        QuarterlyResults for the page with the most recognised rows,
+        or None when no page has revenue and profit rows
+    """
+
+    best = None
+    period_end = None
+
+    for page_number, text in pages:
+        text = text.lower()
+        if period_end is None:
+            period_end = _period_end(text)
+        rows = _page_rows(text)
+        if "revenue" not in rows or "pat" not in rows:
+            continue
+        if best is None or len(rows) > len(best[1]):
+            best = (page_number, rows, _period_end(text))
+
+    if best is None:
+        return None
+
+    # The statement page's own heading wins over the first date seen
+    page_number, rows, page_period_end = best
+    period_end = page_period_end or period_end
+
+    periods = []
+    for column in range(3):
+        p = {f: rows[f][column] if f in rows else None for f in FIELDS}
+
+        # EBITDA when not reported: PBT + finance costs + D&A - other income
+        if p["ebitda"] is None and None not in (
+            p["pbt"], p["finance_costs"], p["depreciation"]
+        ):
+            p["ebitda"] = (
+                p["pbt"] + p["finance_costs"] + p["depreciation"]
+                - (p["other_income"] or 0.0)
+            )
+        periods.append(p)
+
+    current, previous, year_ago = periods
+
+    growth = {
+        "revenue_yoy": _change(current["revenue"], year_ago["revenue"]),
+        "revenue_qoq": _change(current["revenue"], previous["revenue"]),
+        "pat_yoy": _change(current["pat"], year_ago["pat"]),
+        "pat_qoq": _change(current["pat"], previous["pat"]),
+        "ebitda_margin": _ratio(current["ebitda"], current["revenue"]),
+        "net_margin": _ratio(current["pat"], current["revenue"]),
+    }
+
+    checks = {
+        f"{name} ({period})": ok
+        for period, p in zip(PERIODS, periods)
+        for name, ok in _identities(p).items()
+    }
+
+    return QuarterlyResults(
+        page_number, period_end, current, previous, year_ago, growth, checks
+    )
+
+
+# ======================================================
+# OWNERSHIP CHECK
+# ======================================================
+
+# Trailing legal-form words that filings often spell differently
+_LEGAL_FORMS = {"ltd", "limited", "co", "company", "corp", "corporation", "inc"}
+
+
+def statement_mentions(index, company, symbol):
+    """
+    True when a report (ReportIndex) names the company: its name
+    without a leading "the" or trailing legal form ("Larsen & Toubro
+    Ltd." → "larsen toubro", as "&" is not a token), or its ticker
+    symbol as a whole word (symbols under 3 letters are ignored).
+    """
+
+    if index is None:
+        return False
+
+    words = re.findall(r"\w+", (company or "").lower())
+    while words and words[-1] in _LEGAL_FORMS:
+        words.pop()
+    if words[:1] == ["the"]:
+        words = words[1:]
+
+    if words and index.first(" ".join(words), prefix=False) is not None:
+        return True
+
+    return (
+        len(symbol or "") >= 3
+        and index.first(symbol, prefix=False) is not None
+    )
+
+
+# ======================================================
+# FUNDAMENTALS MERGE
+# ======================================================
+
+# fundamentals field -> growth key
+FUNDAMENTALS_FROM_RESULTS = {
+    "RevenueGrowth": "revenue_yoy",
+    "EPSGrowth": "pat_yoy",   # PAT growth as EPS proxy (stable share count)
+    "NetMargin": "net_margin",
+}
+
+
+def results_fundamentals(results):
+    """
+    {fundamentals field: value} taken from validated results.
+    Empty when the statement failed its identity checks.
+    """
+
+    if results is None or not results.valid:
+        return {}
+
+    return {
+        field: results.growth[key]
+        for field, key in FUNDAMENTALS_FROM_RESULTS.items()
+        if results.growth[key] is not None
+    }
+
+
+def merge_quarterly_results(fund, results):
+    """
+    Returns fund (a Fundamentals record) with growth and margin
+    replaced by the figures of a validated results statement.
+    """
+
+    values = results_fundamentals(results)
+    return fund.replace(**values) if values else fund
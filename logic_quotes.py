@@ -0,0 +1,324 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from logic_disk_cache import get_disk_cache, stale_fields, submit_refresh
+from logic_failure_cache import FAILURES
+from logic_providers import get_provider
+from logic_singleflight import coalesce
+from logic_snapshot import get_ticker_info
+
+# ======================================================
+# QUOTE SOURCE STATISTICS
+# ======================================================
+
+class SourceStats:
+    """
+    Rolling latency and success statistics for one quote source.
+    """
+
+    def __init__(self, window=200):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency, success):
+        with self._lock:
+            self.latencies.append(latency)
+            self.outcomes.append(1 if success else 0)
+
+    def _percentile(self, pct):
+        ordered = sorted(self.latencies)
+        if not ordered:
+            return None
+        return ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+
+    def summary(self):
+        with self._lock:
+            attempts = len(self.outcomes)
+            return {
+                "attempts": attempts,
+                "success_rate": (
+                    round(sum(self.outcomes) / attempts, 3) if attempts else None
+                ),
+                "p50_ms": _ms(self._percentile(0.50)),
+                "p95_ms": _ms(self._percentile(0.95)),
+            }
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+# ======================================================
+# SINGLE SYMBOL CMP (HEDGED FALLBACK CHAIN)
+# ======================================================
+
+HEDGE_DELAY_MIN = 0.05
+HEDGE_DELAY_MAX = 0.5
+QUOTE_TIMEOUT = 10.0
+
+
+def _from_fast_info(symbol):
+    return get_provider().quote(symbol)
+
+
+def _from_info(symbol):
+    return get_ticker_info(symbol).get("regularMarketPrice")
+
+
+def _from_history(symbol):
+    hist = get_provider().history(symbol, period="1d")
+    return None if hist.empty else hist.iloc[-1]
+
+
+# Default order (used until statistics exist)
+QUOTE_SOURCES = {
+    "fast_info": _from_fast_info,
+    "info": _from_info,
+    "history": _from_history,
+}
+
+SOURCE_STATS = {name: SourceStats() for name in QUOTE_SOURCES}
+
+_quote_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="quote")
+
+
+def ranked_sources():
+    """
+    Orders quote sources by success rate, then median latency.
+    Sources without statistics keep their default position.
+    """
+
+    def rank(item):
+        position, name = item
+        summary = SOURCE_STATS[name].summary()
+        if not summary["attempts"]:
+            return (0, 0.0, position)
+        return (-summary["success_rate"], summary["p50_ms"], position)
+
+    return [name for _, name in sorted(enumerate(QUOTE_SOURCES), key=rank)]
+
+
+def _hedge_delay(name):
+    """
+    Waits roughly one p95 of the current source before hedging.
+    """
+    p95 = SOURCE_STATS[name].summary()["p95_ms"]
+    if p95 is None:
+        return HEDGE_DELAY_MAX
+    return max(HEDGE_DELAY_MIN, min(HEDGE_DELAY_MAX, p95 / 1000))
+
+
+def _timed_source(name, symbol):
+    started = time.monotonic()
+    price = None
+    try:
+        price = QUOTE_SOURCES[name](symbol)
+    finally:
+        SOURCE_STATS[name].record(time.monotonic() - started, bool(price))
+    return price
+
+
+def quote_source_stats():
+    """
+    Returns per-source attempts, success rate and p50/p95 latency.
+    """
+    return {name: stats.summary() for name, stats in SOURCE_STATS.items()}
+
+
+def fetch_cmp(symbol):
+    """
+    Fetches current market price for one symbol.
+    Sources (fast_info, shared info snapshot, 1-day history) are
+    hedged: the next one starts if the current one is slow or fails.
+    Concurrent calls for the same symbol share one fetch, and
+    symbols that keep failing are skipped while backing off.
+    Returns price rounded to 2 decimals or None.
+    """
+
+    if FAILURES.should_skip(("cmp", symbol)):
+        return None
+
+    return coalesce("cmp", symbol, lambda: _resolve_cmp_tracked(symbol))
+
+
+def _resolve_cmp_tracked(symbol):
+    price = _resolve_cmp(symbol)
+
+    if price:
+        FAILURES.record_success(("cmp", symbol))
+    else:
+        FAILURES.record_failure(("cmp", symbol))
+
+    return price
+
+
+def _resolve_cmp(symbol):
+    order = ranked_sources()
+    futures = {}
+    deadline = time.monotonic() + QUOTE_TIMEOUT
+
+    def launch():
+        name = order[len(futures)]
+        future = _quote_pool.submit(_timed_source, name, symbol)
+        futures[future] = name
+        return name, future
+
+    current, first = launch()
+    pending = {first}
+
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            can_hedge = len(futures) < len(order)
+            done, pending = wait(
+                pending,
+                timeout=min(remaining, _hedge_delay(current))
+                if can_hedge else remaining,
+                return_when=FIRST_COMPLETED
+            )
+
+            for f in done:
+                try:
+                    price = f.result()
+                except Exception:
+                    price = None
+                if price:
+                    return round(price, 2)
+
+            # Slow or failed: start the next source alongside
+            if can_hedge:
+                current, future = launch()
+                pending.add(future)
+    finally:
+        for f in futures:
+            f.cancel()
+
+    return None
+
+
+# ======================================================
+# BULK CMP (ONE BATCHED REQUEST)
+# ======================================================
+
+def fetch_quotes_bulk(symbols, throttle=None):
+    """
+    Resolves current market price for many symbols at once.
+
+    One batched history request covers the whole list; only
+    symbols still missing afterwards fall back to the per-symbol
+    chain. Symbols in failure backoff are skipped entirely.
+
+    Inputs:
+        symbols: iterable of NSE symbols
+        throttle: optional callable(requests) run before each
+                  per-symbol fallback (which may issue up to one
+                  request per quote source); when it returns False
+                  the remaining fallbacks are skipped
+
+    Returns:
+        pd.Series of prices (float, NaN when unavailable),
+        indexed by symbol in input order
+    """
+
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return pd.Series(dtype="float64")
+
+    prices = {}
+    allowed = []
+    for s in symbols:
+        if FAILURES.should_skip(("cmp", s)):
+            prices[s] = None
+        else:
+            allowed.append(s)
+
+    try:
+        closes = get_provider().quotes(allowed) if allowed else {}
+    except Exception:
+        closes = {}
+
+    throttled = False
+
+    for s in allowed:
+        price = closes.get(s)
+        if price:
+            prices[s] = round(price, 2)
+            FAILURES.record_success(("cmp", s))
+        elif throttled or (
+            throttle is not None and not throttle(len(QUOTE_SOURCES))
+        ):
+            # No fallback made: neither a success nor a failure, but a
+            # half-open key must give its probe back
+            throttled = True
+            FAILURES.release(("cmp", s))
+            prices[s] = None
+        else:
+            prices[s] = coalesce(
+                "cmp", s, lambda s=s: _resolve_cmp_tracked(s)
+            )
+
+    return pd.Series(prices, index=symbols, dtype="float64")
+
+
+# ======================================================
+# DISK-CACHED QUOTES (SURVIVE RESTARTS)
+# ======================================================
+
+def store_quotes(prices):
+    """
+    Writes resolved prices to the disk cache (NaN is never stored).
+    """
+    get_disk_cache().put_many("quotes", {
+        s: {"CMP": float(p)} for s, p in prices.items() if pd.notna(p)
+    })
+
+
+def get_quotes(symbols):
+    """
+    Disk-backed bulk quotes.
+
+    Cached prices are served immediately; stale ones are refreshed
+    with one background bulk request and missing ones are fetched
+    inline with fetch_quotes_bulk().
+
+    Returns:
+        pd.Series of prices indexed by symbol (NaN when unavailable)
+    """
+
+    symbols = list(dict.fromkeys(symbols))
+    entries = get_disk_cache().get_many("quotes", symbols)
+
+    prices = {}
+    missing = []
+    stale = []
+
+    for s in symbols:
+        entry = entries.get(s)
+        if entry is None:
+            missing.append(s)
+            continue
+        payload, fetched = entry
+        prices[s] = payload.get("CMP")
+        if stale_fields("quotes", payload, fetched):
+            stale.append(s)
+
+    if missing:
+        fresh = fetch_quotes_bulk(missing)
+        store_quotes(fresh)
+        prices.update(fresh.to_dict())
+
+    if stale:
+        submit_refresh(
+            ("quotes", tuple(stale)),
+            lambda: store_quotes(fetch_quotes_bulk(stale))
+        )
+
+    return pd.Series(prices, index=symbols, dtype="float64")
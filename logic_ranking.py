@@ -0,0 +1,39 @@
+import heapq
+
+# ======================================================
+# STREAMING TOP-K SELECTION
+# ======================================================
+
+def top_k(items, k, key):
+    """
+    Returns the k items with the highest key, best first.
+
+    Consumes items as a stream (any iterable / generator) and keeps
+    only k entries in a min-heap: O(n log k) time, O(k) memory.
+
+    Ties are broken by arrival order (earlier wins), so the result
+    equals sorted(items, key=key, reverse=True)[:k].
+    """
+
+    if k <= 0:
+        return []
+
+    heap = []
+    floor = None
+
+    for seq, item in enumerate(items):
+        value = key(item)
+
+        # Equal keys lose to the earlier item already kept
+        if floor is not None and value <= floor:
+            continue
+
+        if len(heap) < k:
+            heapq.heappush(heap, (value, -seq, item))
+            if len(heap) == k:
+                floor = heap[0][0]
+        else:
+            heapq.heapreplace(heap, (value, -seq, item))
+            floor = heap[0][0]
+
+    return [item for _, _, item in sorted(heap, key=lambda e: e[:2], reverse=True)]
@@ -0,0 +1,186 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from logic_pdf import iter_pages, read_pdf_bytes
+from logic_quarterly import analyze_quarterly_report
+from logic_quarterly_numbers import extract_quarterly_results
+from logic_report_index import ReportIndex
+from logic_singleflight import coalesce
+
+# ======================================================
+# CONTENT-HASH REPORT CACHE (PROCESS-WIDE LRU)
+# ======================================================
+# Uploaded reports are keyed by the sha256 of their bytes, so the
+# same PDF is parsed once per process no matter how many reruns
+# or sessions upload it. Entries are evicted least-recently-used
+# once the cached text exceeds max_chars or max_entries.
+
+
+def file_digest(source):
+    """
+    sha256 hex digest of a PDF (bytes, path or file-like).
+    """
+    return hashlib.sha256(read_pdf_bytes(source)).hexdigest()
+
+
+def _size(value):
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, ReportIndex):
+        return value.chars
+    if isinstance(value, tuple):
+        return sum(_size(v) for v in value)
+    return len(repr(value))
+
+
+class ReportCache:
+    """
+    LRU cache of derived report data, keyed by (kind, digest).
+    Concurrent misses for the same key share one computation.
+    """
+
+    def __init__(self, max_chars=50_000_000, max_entries=64):
+        self.max_chars = max_chars
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key][0]
+            return False, None
+
+    def _store(self, key, value):
+        size = _size(value)
+
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (value, size)
+            self._chars += size
+
+            while self._entries and (
+                self._chars > self.max_chars
+                or len(self._entries) > self.max_entries
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._chars -= evicted
+
+    def peek(self, kind, digest):
+        """
+        (found, value) for a cached entry, without computing it.
+        """
+        return self._lookup((kind, digest))
+
+    def get_or_compute(self, kind, digest, compute):
+        key = (kind, digest)
+
+        found, value = self._lookup(key)
+        if found:
+            return value
+
+        def load():
+            # A concurrent leader may have stored it meanwhile
+            found, value = self._lookup(key)
+            if found:
+                return value
+
+            with self._lock:
+                self.misses += 1
+            value = compute()
+            self._store(key, value)
+            return value
+
+        return coalesce("report", key, load)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "chars": self._chars,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+REPORTS = ReportCache()
+
+
+# -----------------------------
+# Cached report helpers
+# -----------------------------
+def _digest_of(source):
+    data = read_pdf_bytes(source)
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _pages(data, digest, progress):
+    return REPORTS.get_or_compute(
+        "pages", digest,
+        lambda: tuple(
+            text.lower() for _, text in iter_pages(data, progress=progress)
+        )
+    )
+
+
+def report_index(source, progress=None):
+    """
+    ReportIndex of a PDF (page-aware), built once per distinct file.
+    Returns None when no source is given.
+    """
+
+    if not source:
+        return None
+
+    data, digest = _digest_of(source)
+
+    return REPORTS.get_or_compute(
+        "index", digest,
+        lambda: ReportIndex(enumerate(_pages(data, digest, progress), 1))
+    )
+
+
+def quarterly_signals(source, progress=None):
+    """
+    Quarterly signals for a PDF, cached by file hash.
+    Returns (q_score, signals) like analyze_quarterly_text, with
+    each signal citing the page it was found on.
+    """
+
+    if not source:
+        return 0, []
+
+    data, digest = _digest_of(source)
+
+    score, signals = REPORTS.get_or_compute(
+        "quarterly", digest,
+        lambda: tuple(analyze_quarterly_report(report_index(data, progress)))
+    )
+
+    return score, list(signals)
+
+
+def quarterly_results(source, progress=None):
+    """
+    Typed figures of a quarterly results PDF (QuarterlyResults),
+    cached by file hash. None when no statement is recognised.
+    """
+
+    if not source:
+        return None
+
+    data, digest = _digest_of(source)
+
+    return REPORTS.get_or_compute(
+        "results", digest,
+        lambda: extract_quarterly_results(
+            enumerate(_pages(data, digest, progress), 1)
+        )
+    )
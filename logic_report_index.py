@@ -0,0 +1,152 @@
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+# ======================================================
+# POSITIONAL INVERTED INDEX OVER REPORT TEXT
+# ======================================================
+# Built once per document: token → sorted token positions.
+# Queries cost time proportional to the postings they touch,
+# not to the document length, so adding keyword rules does
+# not add full-text scans.
+#
+# Term matching mirrors KeywordMatcher: every word of a query
+# must match whole tokens, except the last one, which matches
+# as a prefix ("loss" finds "losses", never "glossary").
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _contains(positions, value):
+    i = bisect_left(positions, value)
+    return i < len(positions) and positions[i] == value
+
+
+class ReportIndex:
+    """
+    Positional index of a paged document.
+
+    index.find("margin pressure")        → token positions of hits
+    index.first("litigation")            → first position or None
+    index.near("litigation", "material", window=10)
+                                         → (pos_a, pos_b) pairs
+    index.page_of(pos) / index.pages(positions) → page numbers
+    """
+
+    def __init__(self, pages):
+        """
+        pages: iterable of (page_number, text)
+        """
+
+        postings = {}
+        page_starts = []
+        page_numbers = []
+        position = 0
+        chars = 0
+
+        for page_number, text in pages:
+            page_starts.append(position)
+            page_numbers.append(page_number)
+            chars += len(text)
+
+            for token in _TOKEN.findall(text.lower()):
+                entry = postings.get(token)
+                if entry is None:
+                    entry = postings[token] = array("l")
+                entry.append(position)
+                position += 1
+
+        self._postings = postings
+        self._vocabulary = sorted(postings)
+        self._page_starts = page_starts
+        self._page_numbers = page_numbers
+        self.tokens = position
+        self.chars = chars
+
+    @classmethod
+    def from_text(cls, text):
+        return cls([(1, text or "")])
+
+    # -----------------------------
+    # Postings
+    # -----------------------------
+    def _exact(self, token):
+        return self._postings.get(token, ())
+
+    def _prefixed(self, prefix):
+        """
+        Sorted positions of every token starting with prefix.
+        """
+
+        vocabulary = self._vocabulary
+        i = bisect_left(vocabulary, prefix)
+        lists = []
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            lists.append(self._postings[vocabulary[i]])
+            i += 1
+
+        if len(lists) == 1:
+            return lists[0]
+        return sorted(p for positions in lists for p in positions)
+
+    def _hits(self, query, prefix=True):
+        words = _TOKEN.findall(query.lower())
+        if not words:
+            return
+
+        lists = [self._exact(w) for w in words[:-1]]
+        lists.append(
+            self._prefixed(words[-1]) if prefix else self._exact(words[-1])
+        )
+
+        # Walk the rarest word's postings; binary-search the others
+        rarest = min(range(len(lists)), key=lambda i: len(lists[i]))
+        others = [i for i in range(len(lists)) if i != rarest]
+
+        for p in lists[rarest]:
+            start = p - rarest
+            if all(_contains(lists[i], start + i) for i in others):
+                yield start
+
+    def find(self, query, prefix=True):
+        """
+        Sorted start positions of a keyword or phrase.
+        prefix=False matches the last word as a whole token too.
+        """
+        return list(self._hits(query, prefix))
+
+    def first(self, query, prefix=True):
+        """
+        First start position of a keyword or phrase, or None.
+        Stops at the first hit.
+        """
+        return next(self._hits(query, prefix), None)
+
+    def near(self, a, b, window=10):
+        """
+        Pairs (pos_a, pos_b) where query b starts within `window`
+        tokens of query a (either side). Linear merge of postings.
+        """
+
+        first, second = self.find(a), self.find(b)
+        pairs = []
+        lo = 0
+
+        for p in first:
+            while lo < len(second) and second[lo] < p - window:
+                lo += 1
+            i = lo
+            while i < len(second) and second[i] <= p + window:
+                pairs.append((p, second[i]))
+                i += 1
+
+        return pairs
+
+    # -----------------------------
+    # Pages
+    # -----------------------------
+    def page_of(self, position):
+        return self._page_numbers[bisect_right(self._page_starts, position) - 1]
+
+    def pages(self, positions):
+        return sorted({self.page_of(p) for p in positions})
@@ -0,0 +1,162 @@
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from logic_pdf import read_pdf_bytes
+from logic_report_cache import (
+    REPORTS,
+    file_digest,
+    quarterly_results,
+    quarterly_signals,
+    report_index
+)
+
+# ======================================================
+# BACKGROUND REPORT INGESTION
+# ======================================================
+# Uploaded PDFs are parsed off the script thread so the page can
+# render before extraction finishes. A job per (kind, file hash)
+# fills the content-hash report cache; reruns poll job.ready and
+# read job.value once it is set. Progress is recorded on the job,
+# never drawn from the worker thread.
+#
+# Jobs keep only the file hash: job.value reads the data back from
+# REPORTS, so parsed reports stay within the cache's size bound
+# however many jobs or sessions refer to them. A job whose data
+# was evicted reports .evicted and is restarted on resubmit.
+
+# index: ReportIndex; q_score / q_signals / results only for
+# quarterly reports (0, [], None otherwise)
+ReportData = namedtuple(
+    "ReportData", ["index", "q_score", "q_signals", "results"]
+)
+
+
+class ReportJob:
+    """
+    One background ingestion.
+
+    job.ready           → finished (successfully or not)
+    job.value           → ReportData once ready (None on error
+                          or after eviction from REPORTS)
+    job.evicted         → finished fine, but its data was evicted
+    job.error           → exception message, or None
+    job.done / .total   → pages extracted so far / page count
+    """
+
+    def __init__(self, kind, digest):
+        self.kind = kind
+        self.digest = digest
+        self.done = 0
+        self.total = 0
+        self.error = None
+        self._finished = threading.Event()
+
+    @property
+    def ready(self):
+        return self._finished.is_set()
+
+    @property
+    def value(self):
+        if not self.ready or self.error is not None:
+            return None
+
+        parts = [REPORTS.peek(kind, self.digest) for kind in self._kinds()]
+        if not all(found for found, _ in parts):
+            return None
+
+        values = [value for _, value in parts]
+        if self.kind == "quarterly":
+            index, (q_score, q_signals), results = values
+            return ReportData(index, q_score, list(q_signals), results)
+        return ReportData(values[0], 0, [], None)
+
+    @property
+    def evicted(self):
+        return self.ready and self.error is None and self.value is None
+
+    def _kinds(self):
+        if self.kind == "quarterly":
+            return ("index", "quarterly", "results")
+        return ("index",)
+
+    def wait(self, timeout=None):
+        return self._finished.wait(timeout)
+
+    def _progress(self, done, total):
+        self.done, self.total = done, total
+
+    def _run(self, data):
+        try:
+            report_index(data, self._progress)
+            if self.kind == "quarterly":
+                quarterly_signals(data)
+                quarterly_results(data)
+            # Evicted on arrival: restarting would only repeat this
+            if not all(REPORTS.peek(k, self.digest)[0] for k in self._kinds()):
+                self.error = "report is too large for the report cache"
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self._finished.set()
+
+
+class ReportIngestor:
+    """
+    Runs report ingestion on a small thread pool.
+    Each worker hands page extraction to logic_pdf's process pool,
+    so a couple of threads are enough.
+
+    The same file (by content hash) submitted again, from any
+    session, returns the existing job unless it failed or its data
+    was evicted. Up to max_jobs recent jobs are remembered; older
+    finished ones are dropped.
+    """
+
+    def __init__(self, max_workers=2, max_jobs=32):
+        self.max_jobs = max_jobs
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="report-ingest"
+        )
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, source, kind="annual"):
+        """
+        Starts (or finds) the job for a PDF.
+        Returns None when no source is given.
+        """
+
+        if not source:
+            return None
+
+        data = read_pdf_bytes(source)
+        digest = file_digest(data)
+        key = (kind, digest)
+
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.error is None and not job.evicted:
+                self._jobs.move_to_end(key)
+                return job
+
+            job = self._jobs[key] = ReportJob(kind, digest)
+
+            while len(self._jobs) > self.max_jobs:
+                oldest = next(iter(self._jobs))
+                if not self._jobs[oldest].ready:
+                    break
+                del self._jobs[oldest]
+
+        self._pool.submit(job._run, data)
+        return job
+
+    def stats(self):
+        with self._lock:
+            return {
+                "jobs": len(self._jobs),
+                "pending": sum(not j.ready for j in self._jobs.values()),
+            }
+
+
+REPORT_JOBS = ReportIngestor()
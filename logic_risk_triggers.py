@@ -1,7 +1,24 @@
+from logic_rules import evaluate_rules, rule_view
+
 # ======================================================
 # THESIS INVALIDATION & RISK TRIGGERS ENGINE
 # ======================================================
 
+TRIGGER_RULES = rule_view([
+    # Growth deterioration
+    ("RevenueGrowth<0.08", "Revenue growth weakens below 8%."),
+    ("EPSGrowth<0.1", "Earnings growth falls below 10%."),
+    # Balance sheet stress
+    ("DebtEquity>1.5", "Debt-to-equity rises beyond comfortable levels."),
+    ("InterestCover<2", "Interest coverage weakens below 2×."),
+    # Profitability erosion
+    ("ROCE<0.12", "Return on capital drops below 12%."),
+    ("NetMargin<0.08", "Net profit margin compresses below 8%."),
+    # Valuation risk
+    ("PE>40", "Valuation expands beyond reasonable PE levels."),
+])
+
+
 def risk_triggers(
     fund,
     score,
@@ -19,40 +36,12 @@ def risk_triggers(
         triggers: list[str]
     """
 
-    triggers = []
-
-    # --------------------------------------------------
-    # Growth deterioration
-    # --------------------------------------------------
-    if fund.get("RevenueGrowth") is not None and fund["RevenueGrowth"] < 0.08:
-        triggers.append("Revenue growth weakens below 8%.")
-
-    if fund.get("EPSGrowth") is not None and fund["EPSGrowth"] < 0.10:
-        triggers.append("Earnings growth falls below 10%.")
+    fired = evaluate_rules(fund)
 
     # --------------------------------------------------
-    # Balance sheet stress
-    # --------------------------------------------------
-    if fund.get("DebtEquity") is not None and fund["DebtEquity"] > 1.5:
-        triggers.append("Debt-to-equity rises beyond comfortable levels.")
-
-    if fund.get("InterestCover") is not None and fund["InterestCover"] < 2:
-        triggers.append("Interest coverage weakens below 2×.")
-
-    # --------------------------------------------------
-    # Profitability erosion
-    # --------------------------------------------------
-    if fund.get("ROCE") is not None and fund["ROCE"] < 0.12:
-        triggers.append("Return on capital drops below 12%.")
-
-    if fund.get("NetMargin") is not None and fund["NetMargin"] < 0.08:
-        triggers.append("Net profit margin compresses below 8%.")
-
-    # --------------------------------------------------
-    # Valuation risk
+    # Fundamentals (rule table)
     # --------------------------------------------------
-    if fund.get("PE") is not None and fund["PE"] > 40:
-        triggers.append("Valuation expands beyond reasonable PE levels.")
+    triggers = [text for rule, text in TRIGGER_RULES if rule in fired]
 
     # --------------------------------------------------
     # Score deterioration
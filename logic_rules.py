@@ -0,0 +1,164 @@
+import operator
+from functools import lru_cache
+
+import numpy as np
+
+# ======================================================
+# DECLARATIVE FUNDAMENTALS RULE TABLE
+# ======================================================
+# Every threshold check on a fundamentals metric lives here,
+# once. Scoring, metric labels, red flags, profile mismatches
+# and risk triggers are thin views over the fired rule ids.
+#
+# Rule id = f"{metric}{op}{threshold:g}", e.g. "ROE>=0.18".
+# A missing metric (None / NaN) never fires a rule.
+
+RULES = [
+    # Return on equity / capital
+    ("ROE", ">=", 0.18),
+    ("ROE", ">=", 0.15),
+    ("ROE", ">=", 0.10),
+    ("ROE", "<", 0.10),
+    ("ROCE", ">=", 0.15),
+    ("ROCE", ">=", 0.10),
+    ("ROCE", "<", 0.12),
+
+    # Leverage & debt servicing
+    ("DebtEquity", "<=", 1),
+    ("DebtEquity", "<=", 2),
+    ("DebtEquity", ">", 1),
+    ("DebtEquity", ">", 1.5),
+    ("DebtEquity", ">", 2),
+    ("InterestCover", ">=", 3),
+    ("InterestCover", ">=", 1.5),
+    ("InterestCover", "<", 2),
+    ("InterestCover", "<", 1.5),
+
+    # Margins & growth
+    ("NetMargin", "<", 0.08),
+    ("NetMargin", "<", 0.05),
+    ("RevenueGrowth", ">=", 0.10),
+    ("RevenueGrowth", ">=", 0.05),
+    ("RevenueGrowth", "<", 0.08),
+    ("RevenueGrowth", "<", 0),
+    ("EPSGrowth", ">=", 0.10),
+    ("EPSGrowth", ">=", 0.05),
+    ("EPSGrowth", "<", 0.10),
+    ("EPSGrowth", "<", 0),
+
+    # Valuation
+    ("PE", "<=", 25),
+    ("PE", "<=", 40),
+    ("PE", ">", 30),
+    ("PE", ">", 40),
+    ("PE", ">", 45),
+]
+
+_OPS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+}
+
+
+def rule_id(metric, op, threshold):
+    return f"{metric}{op}{threshold:g}"
+
+
+# -----------------------------
+# Compile once at import
+# -----------------------------
+RULE_IDS = [rule_id(*r) for r in RULES]
+
+METRICS = list(dict.fromkeys(metric for metric, _, _ in RULES))
+
+# metric -> [(rule id, comparison, threshold)]
+_COMPILED = {m: [] for m in METRICS}
+for (metric, op, threshold), rid in zip(RULES, RULE_IDS):
+    _COMPILED[metric].append((rid, _OPS[op], threshold))
+
+
+def rule_view(entries):
+    """
+    Validates a view table whose first column is a rule id.
+    Raises KeyError at import time for unknown ids.
+    """
+
+    known = set(RULE_IDS)
+    for entry in entries:
+        rid = entry[0] if isinstance(entry, tuple) else entry
+        if rid not in known:
+            raise KeyError(f"Unknown rule id: {rid}")
+    return entries
+
+
+# ======================================================
+# EVALUATION
+# ======================================================
+
+@lru_cache(maxsize=4096)
+def _evaluate_values(values):
+    fired = []
+    for metric, value in zip(METRICS, values):
+        if value is None or value != value:
+            continue
+        for rid, compare, threshold in _COMPILED[metric]:
+            if compare(value, threshold):
+                fired.append(rid)
+    return frozenset(fired)
+
+
+def fundamentals_fingerprint(fund):
+    """
+    Hashable key of the metric values the rule table depends on.
+    """
+    return tuple(fund.get(m) for m in METRICS)
+
+
+def evaluate_fingerprint(fingerprint):
+    """
+    Fired rule ids for a fingerprint (memoized).
+    """
+    return _evaluate_values(fingerprint)
+
+
+def evaluate_rules(fund):
+    """
+    Returns the frozenset of rule ids that fire for one stock.
+    Evaluated in a single pass and memoized on the metric values,
+    so every view over the same fundamentals shares one evaluation.
+    """
+
+    return _evaluate_values(fundamentals_fingerprint(fund))
+
+
+def evaluate_frame(frame):
+    """
+    Evaluates every rule for a whole universe at once.
+
+    Inputs:
+        frame: DataFrame (or dict of arrays) of metrics, NaN = missing
+
+    Returns:
+        {rule id: bool ndarray}
+    """
+
+    if isinstance(frame, dict):
+        # len() of a dict counts metrics; rows come from a column
+        n = len(next(iter(frame.values()), ()))
+    else:
+        n = len(frame)
+
+    flags = {}
+
+    with np.errstate(invalid="ignore"):
+        for metric, checks in _COMPILED.items():
+            if metric in frame:
+                values = np.asarray(frame[metric], dtype="float64")
+            else:
+                values = np.full(n, np.nan)
+            for rid, compare, threshold in checks:
+                flags[rid] = compare(values, threshold)
+
+    return flags
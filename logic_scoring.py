@@ -1,45 +1,96 @@
+from functools import lru_cache
+
+from logic_keywords import KeywordMatcher
+from logic_report_index import ReportIndex
+from logic_rules import (
+    evaluate_fingerprint,
+    evaluate_rules,
+    fundamentals_fingerprint,
+    rule_view
+)
+
 # ======================================================
 # RISK PROFILE MISMATCH DETECTION
 # ======================================================
 
+# (rule, profile, warning) — evaluated in table order
+MISMATCH_RULES = rule_view([
+    ("DebtEquity>1", "Conservative", "High leverage unsuitable for conservative profile."),
+    ("InterestCover<2", "Conservative", "Low interest coverage for conservative investor."),
+    ("PE>30", "Conservative", "High valuation limits margin of safety."),
+    ("PE>40", "Moderate", "High valuation weakens risk–reward balance."),
+    ("PE>45", "Aggressive", "Extreme valuation even for aggressive profile."),
+])
+
+
 def detect_profile_mismatch(fund, risk_profile):
     """
     Detects mismatch between stock characteristics and investor risk profile.
     Returns warnings (soft penalties, not hard fails).
     """
 
-    warnings = []
+    return _profile_mismatches(evaluate_rules(fund), risk_profile)
+
+
+def _profile_mismatches(fired, risk_profile):
+    return [
+        warning for rule, profile, warning in MISMATCH_RULES
+        if profile == risk_profile and rule in fired
+    ]
 
-    debt = fund.get("DebtEquity")
-    pe = fund.get("PE")
-    interest = fund.get("InterestCover")
 
-    # Conservative investor checks
-    if risk_profile == "Conservative":
-        if debt is not None and debt > 1:
-            warnings.append("High leverage unsuitable for conservative profile.")
-        if interest is not None and interest < 2:
-            warnings.append("Low interest coverage for conservative investor.")
-        if pe is not None and pe > 30:
-            warnings.append("High valuation limits margin of safety.")
+# ======================================================
+# ANNUAL REPORT RISK CHECK
+# ======================================================
+
+ANNUAL_RISK_KEYWORDS = ["material risk", "litigation"]
 
-    # Moderate investor checks
-    if risk_profile == "Moderate":
-        if pe is not None and pe > 40:
-            warnings.append("High valuation weakens risk–reward balance.")
+ANNUAL_RISK_MATCHER = KeywordMatcher(ANNUAL_RISK_KEYWORDS)
 
-    # Aggressive investor checks
-    if risk_profile == "Aggressive":
-        if pe is not None and pe > 45:
-            warnings.append("Extreme valuation even for aggressive profile.")
 
-    return warnings
+def annual_report_risk(annual_text):
+    """
+    True when the annual report mentions material risk or litigation.
+    Accepts the report text or its ReportIndex (index lookups only).
+
+    Not memoized: holding reports here would bypass the size bound
+    of the report cache, and on a ReportIndex the check is two
+    postings lookups.
+    """
+
+    if not annual_text:
+        return False
+
+    if isinstance(annual_text, ReportIndex):
+        return any(
+            annual_text.first(kw) is not None for kw in ANNUAL_RISK_KEYWORDS
+        )
+
+    return bool(ANNUAL_RISK_MATCHER.found(annual_text))
 
 
 # ======================================================
 # CORE STOCK SCORING ENGINE
 # ======================================================
 
+# (rule, score delta, reason) — fundamental quality, growth
+# quality and valuation discipline, in reporting order
+SCORE_RULES = rule_view([
+    ("ROE>=0.18", 8, "Strong return on equity."),
+    ("ROE<0.1", -6, "Weak return on equity."),
+    ("DebtEquity<=1", 6, "Low leverage."),
+    ("DebtEquity>2", -8, "High leverage risk."),
+    ("InterestCover>=3", 4, "Comfortable interest coverage."),
+    ("InterestCover<1.5", -7, "Debt servicing risk."),
+    ("RevenueGrowth>=0.1", 5, "Healthy revenue growth."),
+    ("RevenueGrowth<0", -6, "Revenue contraction."),
+    ("EPSGrowth>=0.1", 5, "Strong earnings growth."),
+    ("EPSGrowth<0", -6, "Earnings decline."),
+    ("PE<=25", 4, "Reasonable valuation."),
+    ("PE>40", -7, "Expensive valuation."),
+])
+
+
 def score_stock(
     fund,
     news_summary,
@@ -52,99 +103,103 @@ def score_stock(
     - score (0–100)
     - recommendation (BUY / HOLD / AVOID)
     - reasons (list of strings)
+
+    Equivalent to apply_profile_overlay(score_stock_base(...)):
+    the profile-independent part is cached, so re-scoring the same
+    stock for another risk profile only re-runs the overlay.
     """
 
+    return apply_profile_overlay(
+        score_stock_base(fund, news_summary, annual_text),
+        risk_profile
+    )
+
+
+# ======================================================
+# PROFILE-INDEPENDENT BASE SCORE (CACHED)
+# ======================================================
+
+def score_stock_base(fund, news_summary, annual_text):
+    """
+    Profile-independent part of score_stock.
+
+    Returns:
+        (raw_score, reasons tuple, fired rule ids)
+        cached on a fingerprint of the fundamentals, the news bias
+        and the annual-report risk flag
+    """
+
+    bias = news_summary.get("overall") if news_summary else None
+
+    return _base_score(
+        fundamentals_fingerprint(fund),
+        bias,
+        annual_report_risk(annual_text)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _base_score(fingerprint, bias, annual_risk):
     score = 50
     reasons = []
 
     # --------------------------------------------------
-    # FUNDAMENTAL QUALITY
+    # FUNDAMENTAL QUALITY, GROWTH & VALUATION
     # --------------------------------------------------
 
-    if fund.get("ROE") is not None:
-        if fund["ROE"] >= 0.18:
-            score += 8
-            reasons.append("Strong return on equity.")
-        elif fund["ROE"] < 0.10:
-            score -= 6
-            reasons.append("Weak return on equity.")
-
-    if fund.get("DebtEquity") is not None:
-        if fund["DebtEquity"] <= 1:
-            score += 6
-            reasons.append("Low leverage.")
-        elif fund["DebtEquity"] > 2:
-            score -= 8
-            reasons.append("High leverage risk.")
-
-    if fund.get("InterestCover") is not None:
-        if fund["InterestCover"] >= 3:
-            score += 4
-            reasons.append("Comfortable interest coverage.")
-        elif fund["InterestCover"] < 1.5:
-            score -= 7
-            reasons.append("Debt servicing risk.")
+    fired = evaluate_fingerprint(fingerprint)
+
+    for rule, delta, reason in SCORE_RULES:
+        if rule in fired:
+            score += delta
+            reasons.append(reason)
 
     # --------------------------------------------------
-    # GROWTH QUALITY
+    # NEWS INTELLIGENCE (SOFT SIGNAL)
     # --------------------------------------------------
 
-    if fund.get("RevenueGrowth") is not None:
-        if fund["RevenueGrowth"] >= 0.10:
-            score += 5
-            reasons.append("Healthy revenue growth.")
-        elif fund["RevenueGrowth"] < 0:
-            score -= 6
-            reasons.append("Revenue contraction.")
-
-    if fund.get("EPSGrowth") is not None:
-        if fund["EPSGrowth"] >= 0.10:
-            score += 5
-            reasons.append("Strong earnings growth.")
-        elif fund["EPSGrowth"] < 0:
-            score -= 6
-            reasons.append("Earnings decline.")
+    if bias == "Positive":
+        score += 3
+        reasons.append("Positive news sentiment.")
+    elif bias == "Negative":
+        score -= 4
+        reasons.append("Negative news sentiment.")
 
     # --------------------------------------------------
-    # VALUATION DISCIPLINE
+    # ANNUAL REPORT SIGNALS
     # --------------------------------------------------
 
-    if fund.get("PE") is not None:
-        if fund["PE"] <= 25:
-            score += 4
-            reasons.append("Reasonable valuation.")
-        elif fund["PE"] > 40:
-            score -= 7
-            reasons.append("Expensive valuation.")
+    if annual_risk:
+        score -= 4
+        reasons.append("Risk disclosures noted in annual report.")
 
-    # --------------------------------------------------
-    # NEWS INTELLIGENCE (SOFT SIGNAL)
-    # --------------------------------------------------
+    return score, tuple(reasons), fired
 
-    if news_summary:
-        bias = news_summary.get("overall")
 
-        if bias == "Positive":
-            score += 3
-            reasons.append("Positive news sentiment.")
-        elif bias == "Negative":
-            score -= 4
-            reasons.append("Negative news sentiment.")
+# ======================================================
+# PROFILE OVERLAY (CHEAP, PER RISK PROFILE)
+# ======================================================
 
-    # --------------------------------------------------
-    # ANNUAL REPORT SIGNALS
-    # --------------------------------------------------
+def apply_profile_overlay(base, risk_profile):
+    """
+    Applies the risk-profile mismatch penalty to a base score.
+
+    Inputs:
+        base: result of score_stock_base()
+        risk_profile: Conservative / Moderate / Aggressive
+
+    Returns:
+        score (0–100), recommendation, reasons (new list)
+    """
 
-    if annual_text:
-        if "material risk" in annual_text or "litigation" in annual_text:
-            score -= 4
-            reasons.append("Risk disclosures noted in annual report.")
+    score, reasons, fired = base
+    reasons = list(reasons)
 
     # --------------------------------------------------
     # RISK PROFILE ALIGNMENT (SOFT PENALTY)
     # --------------------------------------------------
 
-    mismatches = detect_profile_mismatch(fund, risk_profile)
+    mismatches = _profile_mismatches(fired, risk_profile)
 
     if mismatches:
         score -= min(6, 2 * len(mismatches))
@@ -0,0 +1,173 @@
+import numpy as np
+
+from logic_batch_scoring import FUND_COLUMNS, fundamentals_frame, score_batch
+from logic_fundamentals_record import FundamentalsFrame
+from logic_rules import RULES
+from logic_scoring import annual_report_risk
+
+# ======================================================
+# WHAT-IF SENSITIVITY ENGINE (RECOMMENDATION FLIPS)
+# ======================================================
+
+# Metric → (low, high) range scanned for each stock
+SENSITIVITY_GRID = {
+    "PE": (0.0, 80.0),
+    "ROE": (-0.20, 0.50),
+    "DebtEquity": (0.0, 4.0),
+    "RevenueGrowth": (-0.30, 0.50),
+    "EPSGrowth": (-0.30, 0.50),
+}
+
+
+def _metric_grid(metric, points):
+    """
+    Evenly spaced grid plus every rule threshold for the metric and
+    its nearest neighbours, so flips are located exactly.
+    """
+
+    lo, hi = SENSITIVITY_GRID[metric]
+    thresholds = np.array(
+        [t for m, _, t in RULES if m == metric], dtype="float64"
+    )
+
+    return np.unique(np.concatenate([
+        np.linspace(lo, hi, points),
+        thresholds,
+        np.nextafter(thresholds, -np.inf),
+        np.nextafter(thresholds, np.inf),
+    ]))
+
+
+def sensitivity_batch(
+    frame,
+    risk_profile,
+    news_bias=None,
+    annual_risk=None,
+    points=1000
+):
+    """
+    Finds, for every stock and metric, the smallest change that flips
+    the BUY / HOLD / AVOID recommendation.
+
+    All perturbations for all stocks are scored in a single
+    score_batch call (stocks × metrics × grid points rows).
+
+    Inputs:
+        frame: fundamentals table (see logic_batch_scoring)
+        risk_profile / news_bias / annual_risk: as in score_batch
+        points: evenly spaced grid points per metric
+
+    Returns:
+        one list per stock of flips, each
+        {metric, direction, current, value, change, recommendation}
+        sorted by metric order, then direction ("up" before "down")
+    """
+
+    n = len(frame)
+    columns = {
+        c: np.asarray(frame[c], dtype="float64") if c in frame
+        else np.full(n, np.nan)
+        for c in FUND_COLUMNS
+    }
+
+    _, base_labels, _ = score_batch(
+        FundamentalsFrame(columns), risk_profile, news_bias, annual_risk
+    )
+
+    grids = {m: _metric_grid(m, points) for m in SENSITIVITY_GRID}
+
+    # One block per metric: every stock repeated across that grid
+    perturbed = {c: [] for c in FUND_COLUMNS}
+    for metric, grid in grids.items():
+        for c in FUND_COLUMNS:
+            if c == metric:
+                perturbed[c].append(np.tile(grid, n))
+            else:
+                perturbed[c].append(np.repeat(columns[c], len(grid)))
+
+    # Rows are ordered metric-major, then stock, then grid point
+    offsets = np.cumsum([0] + [len(g) for g in grids.values()])
+    stock_of_row = np.concatenate([
+        np.repeat(np.arange(n), len(g)) for g in grids.values()
+    ])
+
+    def expand(value):
+        if value is None or isinstance(value, (str, bool)):
+            return value
+        return np.asarray(value, dtype=object)[stock_of_row]
+
+    _, labels, _ = score_batch(
+        FundamentalsFrame({c: np.concatenate(p) for c, p in perturbed.items()}),
+        expand(risk_profile),
+        expand(news_bias),
+        expand(annual_risk)
+    )
+
+    results = [[] for _ in range(n)]
+
+    for (metric, grid), start in zip(grids.items(), offsets[:-1] * n):
+        block = labels[start:start + n * len(grid)].reshape(n, len(grid))
+        flipped = block != base_labels[:, None]
+        current = columns[metric]
+
+        for i in range(n):
+            if np.isnan(current[i]):
+                continue
+
+            up = np.flatnonzero(flipped[i] & (grid > current[i]))
+            down = np.flatnonzero(flipped[i] & (grid < current[i]))
+
+            for direction, idx in (("up", up[:1]), ("down", down[-1:])):
+                if idx.size:
+                    value = float(grid[idx[0]])
+                    results[i].append({
+                        "metric": metric,
+                        "direction": direction,
+                        "current": float(current[i]),
+                        "value": value,
+                        "change": value - float(current[i]),
+                        "recommendation": block[i, idx[0]],
+                    })
+
+    return results
+
+
+def what_if(fund, risk_profile, news_summary=None, annual_text="", points=1000):
+    """
+    Sensitivity for a single stock (fundamentals dict).
+    Returns the same flip list as sensitivity_batch for one row.
+    """
+
+    bias = news_summary.get("overall") if news_summary else None
+
+    return sensitivity_batch(
+        fundamentals_frame([fund]),
+        risk_profile,
+        news_bias=bias,
+        annual_risk=annual_report_risk(annual_text),
+        points=points
+    )[0]
+
+
+def describe_flips(flips, current_rec):
+    """
+    Human-readable lines for a flip list.
+    """
+
+    lines = []
+    for f in flips:
+        up = f["direction"] == "up"
+        shown = round(f["value"], 6) + 0.0
+
+        # Flips just past a threshold read as "above" / "below" it
+        if shown == f["value"]:
+            verb = "rises to" if up else "falls to"
+        else:
+            verb = "rises above" if up else "falls below"
+
+        lines.append(
+            f"{f['metric']} {verb} {shown:g} "
+            f"(now {round(f['current'], 3):g}) → {current_rec} becomes "
+            f"{f['recommendation']}"
+        )
+    return lines
@@ -0,0 +1,89 @@
+import threading
+
+# ======================================================
+# SINGLE-FLIGHT REQUEST COALESCING
+# ======================================================
+
+class _Call:
+    __slots__ = ("done", "value", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Process-wide request coalescing.
+
+    Concurrent calls with the same key share one in-flight
+    execution and receive its result (or its exception). Nothing
+    is cached: once the call finishes, the next caller runs again.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.executions = 0
+        self.deduplicated = 0
+
+    def do(self, key, fn):
+        """
+        Runs fn() for key, or waits for an identical call in flight.
+        """
+
+        with self._lock:
+            self.calls += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.deduplicated += 1
+                call.waiters += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+        return call.value
+
+    def stats(self):
+        """
+        Returns call / execution / deduplication counters.
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "executions": self.executions,
+                "deduplicated": self.deduplicated,
+                "in_flight": len(self._calls)
+            }
+
+
+FLIGHTS = SingleFlight()
+
+
+def coalesce(namespace, key, fn):
+    """
+    Shared entry point: coalesces fn() under (namespace, key).
+    """
+    return FLIGHTS.do((namespace, key), fn)
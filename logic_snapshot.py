@@ -0,0 +1,127 @@
+import threading
+import time
+from types import MappingProxyType
+
+from logic_failure_cache import FAILURES
+from logic_providers import get_provider
+
+# ======================================================
+# TICKER SNAPSHOT STORE (SHARED .info PAYLOADS)
+# ======================================================
+
+EMPTY_INFO = MappingProxyType({})
+
+
+def _fetch_info(symbol):
+    """
+    Downloads the raw info payload for one symbol via the provider.
+    """
+    return get_provider().info(symbol) or {}
+
+
+class TickerSnapshotStore:
+    """
+    TTL-bounded, process-wide store of ticker info payloads.
+
+    Each symbol's payload is downloaded once per TTL window and
+    handed out as a read-only mapping, so fundamentals, fair value
+    and CMP lookups all share a single .info request.
+    """
+
+    def __init__(self, ttl=900, fetcher=_fetch_info):
+        self.ttl = ttl
+        self.fetcher = fetcher
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_info(self, symbol):
+        """
+        Returns a read-only info mapping for symbol.
+        Failed or empty downloads yield an empty mapping, are not
+        cached, and back off via the shared FailureTracker.
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry and now - entry[0] < self.ttl:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        key = ("info", symbol)
+        if FAILURES.should_skip(key):
+            return EMPTY_INFO
+
+        try:
+            info = MappingProxyType(dict(self.fetcher(symbol)))
+        except Exception:
+            info = EMPTY_INFO
+
+        if not info:
+            FAILURES.record_failure(key)
+            return EMPTY_INFO
+
+        FAILURES.record_success(key)
+
+        with self._lock:
+            self._entries[symbol] = (time.monotonic(), info)
+
+        return info
+
+    def refresh(self, symbol):
+        """
+        Re-downloads a symbol's payload and swaps it in place,
+        so readers never see a gap. Raises on failure.
+        """
+
+        try:
+            info = MappingProxyType(dict(self.fetcher(symbol)))
+        except Exception:
+            FAILURES.record_failure(("info", symbol))
+            raise
+
+        if not info:
+            FAILURES.record_failure(("info", symbol))
+            return info
+
+        FAILURES.record_success(("info", symbol))
+
+        with self._lock:
+            self._entries[symbol] = (time.monotonic(), info)
+
+        return info
+
+    def invalidate(self, symbol=None):
+        """
+        Drops one symbol (or everything) from the store.
+        """
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def stats(self):
+        """
+        Returns hit / miss counters and current store size.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries)
+            }
+
+
+SNAPSHOTS = TickerSnapshotStore()
+
+
+def get_ticker_info(symbol):
+    """
+    Shared entry point for every module that needs Yahoo .info data.
+    """
+    return SNAPSHOTS.get_info(symbol)
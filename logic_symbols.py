@@ -0,0 +1,114 @@
+import os
+import re
+import threading
+from collections import namedtuple
+
+import pandas as pd
+
+# ======================================================
+# SYMBOL MASTER (NSE SYMBOL → PROVIDER TICKER)
+# ======================================================
+
+UNIVERSE_PATH = "data/nifty50_list.csv"
+MAPPING_PATH = "data/symbol_map.csv"
+
+SymbolInfo = namedtuple("SymbolInfo", ["symbol", "company", "sector", "yahoo"])
+
+_TICKER_RE = re.compile(r"^[A-Z0-9&\-]+\.(NS|BO)$")
+
+
+class SymbolMaster:
+    """
+    Universe of tradable symbols with pre-resolved Yahoo tickers.
+
+    Built once from the universe CSV (Symbol, Company, Sector) plus an
+    optional mapping CSV (Symbol, YahooTicker) for symbols whose Yahoo
+    ticker differs from "<Symbol>.NS". Every lookup is a dict access.
+
+    Raises ValueError at load time for duplicate / blank symbols,
+    mappings to unknown symbols and malformed tickers.
+    """
+
+    def __init__(self, universe_path=UNIVERSE_PATH, mapping_path=MAPPING_PATH):
+        frame = pd.read_csv(universe_path)
+
+        missing = {"Symbol", "Company", "Sector"} - set(frame.columns)
+        if missing:
+            raise ValueError(f"{universe_path}: missing columns {sorted(missing)}")
+
+        frame["Symbol"] = frame["Symbol"].astype(str).str.strip()
+
+        if (frame["Symbol"] == "").any():
+            raise ValueError(f"{universe_path}: blank symbol")
+
+        dupes = frame.loc[frame["Symbol"].duplicated(), "Symbol"].tolist()
+        if dupes:
+            raise ValueError(f"{universe_path}: duplicate symbols {dupes}")
+
+        known = set(frame["Symbol"])
+        overrides = {}
+        if mapping_path and os.path.exists(mapping_path):
+            mapping = pd.read_csv(mapping_path)
+            for sym, ticker in zip(mapping["Symbol"], mapping["YahooTicker"]):
+                sym, ticker = str(sym).strip(), str(ticker).strip()
+                if sym not in known:
+                    raise ValueError(f"{mapping_path}: unknown symbol {sym}")
+                if sym in overrides:
+                    raise ValueError(f"{mapping_path}: duplicate mapping {sym}")
+                overrides[sym] = ticker
+
+        self.frame = frame
+        self._by_symbol = {}
+
+        for row in frame.itertuples(index=False):
+            yahoo = overrides.get(row.Symbol, f"{row.Symbol}.NS")
+            if not _TICKER_RE.match(yahoo):
+                raise ValueError(f"Malformed Yahoo ticker for {row.Symbol}: {yahoo}")
+            self._by_symbol[row.Symbol] = SymbolInfo(
+                row.Symbol, row.Company, row.Sector, yahoo
+            )
+
+    @property
+    def symbols(self):
+        return list(self._by_symbol)
+
+    def get(self, symbol):
+        return self._by_symbol.get(symbol)
+
+    def yahoo_ticker(self, symbol):
+        """
+        Returns the Yahoo ticker; unknown symbols default to "<symbol>.NS".
+        """
+        info = self._by_symbol.get(symbol)
+        return info.yahoo if info else f"{symbol}.NS"
+
+    def company(self, symbol):
+        info = self._by_symbol.get(symbol)
+        return info.company if info else None
+
+    def sector(self, symbol):
+        info = self._by_symbol.get(symbol)
+        return info.sector if info else None
+
+
+_master = None
+_master_lock = threading.Lock()
+
+
+def get_symbol_master():
+    """
+    Returns the process-wide SymbolMaster (built on first use).
+    """
+    global _master
+
+    with _master_lock:
+        if _master is None:
+            _master = SymbolMaster()
+        return _master
+
+
+def yahoo_ticker(symbol):
+    """
+    Shared entry point for every module that calls Yahoo.
+    """
+    return get_symbol_master().yahoo_ticker(symbol)
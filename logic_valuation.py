@@ -1,4 +1,4 @@
-import yfinance as yf
+from logic_snapshot import get_ticker_info
 
 # ======================================================
 # FAIR VALUE & VALUATION ENGINE
@@ -22,11 +22,7 @@ def estimate_fair_value(symbol, fund, get_cmp):
     # -----------------------------
     # EPS FETCH (SAFE)
     # -----------------------------
-    try:
-        info = yf.Ticker(symbol + ".NS").info
-        eps = info.get("trailingEps")
-    except Exception:
-        eps = None
+    eps = get_ticker_info(symbol).get("trailingEps")
 
     pe = fund.get("PE")
 